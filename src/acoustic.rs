@@ -31,8 +31,11 @@ pub struct WordTiming {
     pub end: f32,
 }
 
+/// A retained dictation. The audio is kept as 16-bit PCM — lossless for a
+/// microphone's dynamic range and for the loudness-invariant fingerprints — so
+/// the copy on every dictation moves, and the history holds, half the bytes.
 struct LastAudio {
-    audio: Vec<f32>,
+    pcm: Vec<i16>,
     words: Vec<WordTiming>,
 }
 
@@ -91,7 +94,7 @@ pub fn process(audio: &[f32], raw: &str, words: Vec<WordTiming>, _lang: &str) ->
     let corrected = apply_match(audio, raw, &words, _lang);
     let mut hist = HISTORY.lock_safe();
     hist.push_front(LastAudio {
-        audio: audio.to_vec(),
+        pcm: audio.iter().map(|&s| to_pcm16(s)).collect(),
         words,
     });
     hist.truncate(HISTORY_CAP);
@@ -162,7 +165,7 @@ pub fn learn_word(heard: &str, term: &str) -> bool {
         'search: for last in hist.iter() {
             for w in &last.words {
                 if whisper_push_dict::normalize(&w.text) == hn {
-                    if let Some(fp) = segment_fp(&last.audio, w) {
+                    if let Some(fp) = segment_fp_pcm(&last.pcm, w) {
                         found = Some(fp);
                         break 'search;
                     }
@@ -217,16 +220,34 @@ fn save() {
 }
 
 fn segment_fp(audio: &[f32], w: &WordTiming) -> Option<whisper_push_acoustic::Fingerprint> {
+    let span = word_span(audio.len(), w)?;
+    Some(fingerprint(&audio[span], SAMPLE_RATE))
+}
+
+/// `segment_fp` over retained 16-bit audio: only the word's span is widened
+/// back to f32, and only when a correction actually needs it.
+fn segment_fp_pcm(pcm: &[i16], w: &WordTiming) -> Option<whisper_push_acoustic::Fingerprint> {
+    let span = word_span(pcm.len(), w)?;
+    let audio: Vec<f32> = pcm[span].iter().map(|&s| s as f32 / 32768.0).collect();
+    Some(fingerprint(&audio, SAMPLE_RATE))
+}
+
+/// Sample range of `w` within `len` samples, or None if it's unusable.
+fn word_span(len: usize, w: &WordTiming) -> Option<std::ops::Range<usize>> {
     // Guard against NaN/Inf timings before the f32→usize cast.
     if !w.start.is_finite() || !w.end.is_finite() || w.end <= w.start {
         return None;
     }
-    let s = ((w.start * SAMPLE_RATE as f32).max(0.0) as usize).min(audio.len());
-    let e = ((w.end * SAMPLE_RATE as f32) as usize).min(audio.len());
+    let s = ((w.start * SAMPLE_RATE as f32).max(0.0) as usize).min(len);
+    let e = ((w.end * SAMPLE_RATE as f32) as usize).min(len);
     if e <= s || e - s < MIN_SEGMENT {
         return None;
     }
-    Some(fingerprint(&audio[s..e], SAMPLE_RATE))
+    Some(s..e)
+}
+
+fn to_pcm16(s: f32) -> i16 {
+    (s.clamp(-1.0, 1.0) * 32767.0) as i16
 }
 
 fn eq_ignore(a: &str, b: &str) -> bool {
@@ -3,25 +3,111 @@ use anyhow::Result;
 use cpal::traits::{DeviceTrait, StreamTrait};
 use rubato::Resampler;
 use std::panic::AssertUnwindSafe;
-use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::{Arc, Mutex};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::{Arc, Mutex, Weak};
+use std::time::Duration;
 use tracing::{info, warn};
 
 use super::{RESAMPLE_CHUNK_SIZE, SAMPLE_RATE};
 
 pub const SILENCE_RMS_THRESHOLD: f32 = 0.001;
 
+/// Block RMS at or above which the end-pointer counts a callback block as
+/// speech (≈ −40 dBFS: well above room tone, well below normal speech).
+const ENDPOINT_SPEECH_RMS: f32 = 0.01;
+
 /// Pre-reserve the recording buffer (~30 s @ 16 kHz) so the audio callback's
 /// `extend_from_slice` doesn't reallocate mid-stream (a realloc on the real-time
 /// render thread can cause audible glitches / dropped samples).
 const PREALLOC_SAMPLES: usize = SAMPLE_RATE as usize * 30;
 
+/// Recorded audio as a list of preallocated segments. When one fills up the
+/// callback starts a fresh one rather than growing it — growing a `Vec` would
+/// memcpy the whole recording so far on the real-time thread. `stop` joins them
+/// with one exact-size allocation (none at all for the usual single segment).
+#[derive(Default)]
+struct Segments(Vec<Vec<f32>>);
+
+impl Segments {
+    fn preallocated() -> Self {
+        let mut segments = Vec::with_capacity(8);
+        segments.push(Vec::with_capacity(PREALLOC_SAMPLES));
+        Segments(segments)
+    }
+
+    fn extend_from_slice(&mut self, samples: &[f32]) {
+        match self.0.last_mut() {
+            Some(seg) if seg.capacity() - seg.len() >= samples.len() => {
+                seg.extend_from_slice(samples)
+            }
+            _ => {
+                let mut seg = Vec::with_capacity(PREALLOC_SAMPLES.max(samples.len()));
+                seg.extend_from_slice(samples);
+                self.0.push(seg);
+            }
+        }
+    }
+
+    fn into_contiguous(mut self) -> Vec<f32> {
+        if self.0.len() <= 1 {
+            return self.0.pop().unwrap_or_default();
+        }
+        let total = self.0.iter().map(Vec::len).sum();
+        let mut out = Vec::with_capacity(total);
+        for seg in &self.0 {
+            out.extend_from_slice(seg);
+        }
+        out
+    }
+}
+
+/// End-of-speech tracking for a live recording, fed block by block from the
+/// capture callback: whether speech has been heard yet, and how much silence has
+/// followed the last speech block. Lock-free — the callback only touches atomics.
+pub struct Endpointer {
+    heard_speech: AtomicBool,
+    /// Device-rate frames since the last speech block.
+    quiet_frames: AtomicU64,
+    rate: u32,
+}
+
+impl Endpointer {
+    fn new(rate: u32) -> Self {
+        Self {
+            heard_speech: AtomicBool::new(false),
+            quiet_frames: AtomicU64::new(0),
+            rate: rate.max(1),
+        }
+    }
+
+    fn observe(&self, rms: f32, frames: usize) {
+        if rms >= ENDPOINT_SPEECH_RMS {
+            self.heard_speech.store(true, Ordering::Relaxed);
+            self.quiet_frames.store(0, Ordering::Relaxed);
+        } else {
+            self.quiet_frames
+                .fetch_add(frames as u64, Ordering::Relaxed);
+        }
+    }
+
+    /// Silence since the last speech, or `None` while nothing has been said yet
+    /// (so a recording is never ended before the user starts talking).
+    pub fn trailing_silence(&self) -> Option<Duration> {
+        if !self.heard_speech.load(Ordering::Relaxed) {
+            return None;
+        }
+        let frames = self.quiet_frames.load(Ordering::Relaxed);
+        Some(Duration::from_secs_f64(frames as f64 / self.rate as f64))
+    }
+}
+
 /// Audio recorder that captures to an in-memory f32 buffer at 16kHz mono.
 pub struct AudioCapture {
     stream: Option<cpal::Stream>,
-    buffer: Arc<Mutex<Vec<f32>>>,
+    buffer: Arc<Mutex<Segments>>,
     /// Set if the input stream errored mid-capture (device unplugged, etc.).
     device_lost: Arc<AtomicBool>,
+    endpointer: Arc<Endpointer>,
     /// The device actually opened (after resolving "auto" / a missing pin), so
     /// the pipeline can mark it dead and fall back if it captured no signal.
     device_name: String,
@@ -31,73 +117,98 @@ impl AudioCapture {
     /// Start capturing audio from the specified device (or default).
     pub fn start(device_name: &str) -> Result<Self> {
         let device = super::find_input_device(device_name)?;
-        let config = device.default_input_config()?;
-        let device_sr = config.sample_rate().0;
-        let device_channels = config.channels() as usize;
+        let supported = device.default_input_config()?;
+        let device_sr = supported.sample_rate().0;
+        let device_channels = supported.channels() as usize;
+        // CoreAudio honours a fixed I/O size within the device's range; ALSA and
+        // WASAPI are pickier about it, so they keep the host default.
+        let config = cpal::StreamConfig {
+            #[cfg(target_os = "macos")]
+            buffer_size: capture_buffer_size(supported.buffer_size()),
+            ..supported.config()
+        };
         let resolved_name = device.name().unwrap_or_else(|_| device_name.to_string());
 
         info!("Recording from '{resolved_name}' @ {device_sr}Hz {device_channels}ch");
 
-        let buffer: Arc<Mutex<Vec<f32>>> =
-            Arc::new(Mutex::new(Vec::with_capacity(PREALLOC_SAMPLES)));
+        let buffer = Arc::new(Mutex::new(Segments::preallocated()));
         let buffer_clone = buffer.clone();
         let resampler = super::create_resampler(device_sr)?;
-        let resample_buf: Arc<Mutex<Vec<f32>>> =
-            Arc::new(Mutex::new(Vec::with_capacity(RESAMPLE_CHUNK_SIZE * 4)));
         let device_lost = Arc::new(AtomicBool::new(false));
         let device_lost_cb = device_lost.clone();
+        let endpointer = Arc::new(Endpointer::new(device_sr));
+        let endpointer_cb = endpointer.clone();
 
         // Reused scratch so the real-time audio callback never allocates:
-        //  - `mono`:  downmix output
-        //  - `inbuf`: one resampler input chunk (drained out of `acc`)
-        //  - `out`:   the resampler's output buffer (pre-sized by rubato)
-        let mut mono = Vec::<f32>::with_capacity(RESAMPLE_CHUNK_SIZE * 2);
-        let mut inbuf = Vec::<f32>::with_capacity(RESAMPLE_CHUNK_SIZE);
+        //  - `mono_buf`: downmix output (multi-channel devices only — a mono
+        //                device's buffer is used in place, without a copy)
+        //  - `acc`:  device-rate samples awaiting a full resampler chunk (owned
+        //            by the callback — nothing else touches it, so no lock);
+        //            `consumed` is how much of its front is already resampled
+        //  - `out`:  the resampler's output buffer (pre-sized by rubato)
+        let mut mono_buf = Vec::<f32>::with_capacity(RESAMPLE_CHUNK_SIZE * 2);
+        let mut acc = Vec::<f32>::with_capacity(RESAMPLE_CHUNK_SIZE * 4);
+        let mut consumed = 0usize;
         let mut out: Vec<Vec<f32>> = match resampler {
             Some(ref r) => r.lock_safe().output_buffer_allocate(true),
             None => Vec::new(),
         };
 
         let stream = device.build_input_stream(
-            &config.into(),
+            &config,
             move |data: &[f32], _: &cpal::InputCallbackInfo| {
                 // A panic here would unwind across the CoreAudio C callback — UB.
                 // Contain it: lose this block, keep the stream alive.
                 let _ = std::panic::catch_unwind(AssertUnwindSafe(|| {
-                    super::downmix_into(data, device_channels, &mut mono);
+                    let mono: &[f32] = if device_channels <= 1 {
+                        data
+                    } else {
+                        super::downmix_into(data, device_channels, &mut mono_buf);
+                        &mono_buf
+                    };
 
-                    // Feed the live mic level to the "listening" pill (cheap RMS).
+                    // Feed the live mic level to the "listening" pill and the
+                    // end-pointer (one cheap RMS for both).
                     if !mono.is_empty() {
-                        crate::overlay::feed_level(crate::util::rms(&mono));
+                        let level = crate::util::rms(mono);
+                        crate::overlay::feed_level(level);
+                        endpointer_cb.observe(level, mono.len());
                     }
 
                     if let Some(ref resampler) = resampler {
-                        let mut acc = resample_buf.lock_safe();
-                        acc.extend_from_slice(&mono);
+                        // Compact first: drop what the previous call consumed
+                        // (even if it panicked halfway), then append.
+                        acc.drain(..consumed);
+                        consumed = 0;
+                        acc.extend_from_slice(mono);
                         // `lock_safe` (not bare `lock()`): a poisoned resampler
                         // must not silently stop resampling → empty transcription.
                         let mut r = resampler.lock_safe();
-                        while acc.len() >= RESAMPLE_CHUNK_SIZE {
-                            // Drain the chunk BEFORE resampling, into a reused input
-                            // buffer: a panic inside `process` then can't make us
-                            // re-feed the same samples forever. `process_into_buffer`
-                            // writes into the pre-allocated `out`, so there is NO
-                            // heap allocation on the real-time thread (the plain
-                            // `process` convenience method allocates its output Vec
-                            // every call — the dropout hazard this avoids).
-                            inbuf.clear();
-                            inbuf.extend(acc.drain(..RESAMPLE_CHUNK_SIZE));
-                            if let Ok((_, n_out)) = r.process_into_buffer(&[&inbuf], &mut out, None)
+                        let mut dest = buffer_clone.lock_safe();
+                        // Resample straight out of `acc`, chunk by chunk — no
+                        // per-chunk copy into a separate input buffer and no
+                        // per-chunk memmove of the tail; the consumed prefix is
+                        // dropped once, at the top of the next call.
+                        while acc.len() - consumed >= RESAMPLE_CHUNK_SIZE {
+                            // Advance the cursor BEFORE resampling: a panic inside
+                            // `process` then can't make us re-feed the same samples
+                            // forever. `process_into_buffer` writes into the
+                            // pre-allocated `out`, so there is NO heap allocation
+                            // on the real-time thread (the plain `process`
+                            // convenience method allocates its output Vec every
+                            // call — the dropout hazard this avoids).
+                            let chunk = consumed..consumed + RESAMPLE_CHUNK_SIZE;
+                            consumed = chunk.end;
+                            if let Ok((_, n_out)) =
+                                r.process_into_buffer(&[&acc[chunk]], &mut out, None)
                             {
                                 if let Some(channel) = out.first() {
-                                    buffer_clone
-                                        .lock_safe()
-                                        .extend_from_slice(&channel[..n_out]);
+                                    dest.extend_from_slice(&channel[..n_out]);
                                 }
                             }
                         }
                     } else {
-                        buffer_clone.lock_safe().extend_from_slice(&mono);
+                        buffer_clone.lock_safe().extend_from_slice(mono);
                     }
                 }));
             },
@@ -114,10 +225,17 @@ impl AudioCapture {
             stream: Some(stream),
             buffer,
             device_lost,
+            endpointer,
             device_name: resolved_name,
         })
     }
 
+    /// End-of-speech tracking for this recording. Weak: it stops upgrading once
+    /// the capture is stopped, so a watcher can't outlive its recording.
+    pub fn endpointer(&self) -> Weak<Endpointer> {
+        Arc::downgrade(&self.endpointer)
+    }
+
     /// True if the input stream reported an error mid-capture (device unplugged).
     pub fn device_lost(&self) -> bool {
         self.device_lost.load(Ordering::Relaxed)
@@ -137,7 +255,7 @@ impl AudioCapture {
             let _ = stream.pause();
         }
         self.stream.take();
-        let audio = std::mem::take(&mut *self.buffer.lock_safe());
+        let audio = std::mem::take(&mut *self.buffer.lock_safe()).into_contiguous();
         let duration = audio.len() as f32 / SAMPLE_RATE as f32;
         let rms = crate::util::rms(&audio);
         let max = audio.iter().map(|s| s.abs()).fold(0.0f32, f32::max);
@@ -157,6 +275,20 @@ impl AudioCapture {
     }
 }
 
+/// Device frames per callback: one resampler chunk, so each callback moves a
+/// bounded block that feeds ~one `process` call and the scratch buffers never
+/// grow — instead of the host's default burst size. Kept within the range the
+/// device reports; the host default when it reports none.
+#[cfg_attr(not(target_os = "macos"), allow(dead_code))]
+fn capture_buffer_size(supported: &cpal::SupportedBufferSize) -> cpal::BufferSize {
+    match *supported {
+        cpal::SupportedBufferSize::Range { min, max } => {
+            cpal::BufferSize::Fixed((RESAMPLE_CHUNK_SIZE as u32).max(min).min(max))
+        }
+        cpal::SupportedBufferSize::Unknown => cpal::BufferSize::Default,
+    }
+}
+
 impl Drop for AudioCapture {
     fn drop(&mut self) {
         if let Some(stream) = self.stream.as_ref() {
@@ -165,3 +297,43 @@ impl Drop for AudioCapture {
         self.stream.take();
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_endpointer_counts_silence_after_speech_only() {
+        let ep = Endpointer::new(16_000);
+        ep.observe(0.0, 16_000);
+        assert_eq!(ep.trailing_silence(), None); // nothing said yet
+        ep.observe(0.2, 512);
+        assert_eq!(ep.trailing_silence(), Some(Duration::ZERO));
+        ep.observe(0.001, 8_000);
+        ep.observe(0.001, 8_000);
+        assert_eq!(ep.trailing_silence(), Some(Duration::from_secs(1)));
+        ep.observe(0.2, 512); // speech again resets the count
+        assert_eq!(ep.trailing_silence(), Some(Duration::ZERO));
+    }
+
+    #[test]
+    fn test_segments_single_segment_is_returned_as_is() {
+        let mut seg = Segments::preallocated();
+        seg.extend_from_slice(&[0.1, 0.2]);
+        seg.extend_from_slice(&[0.3]);
+        assert_eq!(seg.0.len(), 1);
+        assert_eq!(seg.into_contiguous(), vec![0.1, 0.2, 0.3]);
+    }
+
+    #[test]
+    fn test_segments_overflow_starts_new_segment_in_order() {
+        let mut seg = Segments::preallocated();
+        let block = vec![0.5f32; PREALLOC_SAMPLES - 1];
+        seg.extend_from_slice(&block);
+        seg.extend_from_slice(&[1.0, 2.0]); // doesn't fit → new segment
+        assert_eq!(seg.0.len(), 2);
+        let audio = seg.into_contiguous();
+        assert_eq!(audio.len(), PREALLOC_SAMPLES + 1);
+        assert_eq!(&audio[PREALLOC_SAMPLES - 1..], &[1.0, 2.0]);
+    }
+}
@@ -3,9 +3,10 @@ pub mod decode;
 pub mod playback;
 pub mod stream;
 
+use crate::util::LockSafe;
 use anyhow::Result;
 use cpal::traits::{DeviceTrait, HostTrait};
-use rubato::FftFixedIn;
+use rubato::{FftFixedIn, Resampler};
 use std::sync::{Arc, Mutex, RwLock};
 
 /// Whisper expects 16kHz mono audio.
@@ -19,6 +20,24 @@ pub const RESAMPLE_CHUNK_SIZE: usize = 1024;
 /// *some* ambient peak, a not-working one is flatline. Triggers the input
 /// auto-fallback in the record pipeline.
 pub const DEAD_MIC_PEAK: f32 = 1e-4;
+/// Peak amplitude (−46 dBFS) a recording must reach to contain speech at all.
+/// Below it the take is room tone — an accidental press, or a hold with nothing
+/// said — and the pipeline skips the engine instead of spending a full
+/// inference on it (Whisper tends to hallucinate "Thank you." on such input).
+pub const SPEECH_MIN_PEAK: f32 = 0.005;
+
+/// Silence trimming works on 20 ms frames.
+const TRIM_FRAME: usize = SAMPLE_RATE as usize / 50;
+/// Audio kept on each side of the voiced region, so a soft onset or a trailing
+/// consonant is never clipped.
+const TRIM_PAD: usize = SAMPLE_RATE as usize / 4;
+/// The room's noise floor is this percentile of the per-frame peaks: a low one,
+/// so a loud transient (desk knock, key clack, plosive) can't move it the way
+/// it moves the recording's overall peak.
+const TRIM_NOISE_PERCENTILE: usize = 10;
+/// A frame is voiced when its peak is this many times the noise floor (+12 dB),
+/// and at least `SPEECH_MIN_PEAK`, so a quiet room's hiss never counts.
+const TRIM_NOISE_MARGIN: f32 = 4.0;
 
 /// Upper bound on a CoreAudio device enumeration. `cpal`'s `input_devices()` /
 /// `output_devices()` call into CoreAudio with no deadline of their own, and a
@@ -54,6 +73,19 @@ pub fn list_output_devices() -> Result<Vec<String>> {
     .ok_or_else(|| anyhow::anyhow!("output device enumeration timed out (CoreAudio stalled)"))
 }
 
+// The pinned input device found by the last lookup on this thread (captures
+// all open on the pipeline thread). A CoreAudio device is just an object ID, so
+// holding one is free; checking that it still carries the pinned name is one
+// property read, against a full enumeration — unbounded, see
+// `DEVICE_ENUM_TIMEOUT` — on every press. A vanished device fails the name
+// read, so the next lookup enumerates again. macOS only: an ALSA device handle
+// can keep the PCM open while cached.
+#[cfg(target_os = "macos")]
+thread_local! {
+    static PINNED_INPUT: std::cell::RefCell<Option<cpal::Device>> =
+        const { std::cell::RefCell::new(None) };
+}
+
 /// Find an input device by name ("auto" = default).
 pub fn find_input_device(name: &str) -> Result<cpal::Device> {
     let host = cpal::default_host();
@@ -61,8 +93,21 @@ pub fn find_input_device(name: &str) -> Result<cpal::Device> {
         host.default_input_device()
             .ok_or_else(|| anyhow::anyhow!("No input device found"))
     } else {
-        host.input_devices()?
-            .find(|d| d.name().map(|n| n == name).unwrap_or(false))
+        #[cfg(target_os = "macos")]
+        if let Some(device) = PINNED_INPUT.with_borrow(|cached| {
+            cached
+                .as_ref()
+                .filter(|d| d.name().is_ok_and(|n| n == name))
+                .cloned()
+        }) {
+            return Ok(device);
+        }
+        let found = host
+            .input_devices()?
+            .find(|d| d.name().map(|n| n == name).unwrap_or(false));
+        #[cfg(target_os = "macos")]
+        PINNED_INPUT.set(found.clone());
+        found
             .or_else(|| {
                 // The pinned device is gone (unplugged headset, disconnected
                 // dock). Rather than refuse to record, fall back to the system
@@ -182,19 +227,40 @@ pub fn next_working_mic(dead: &str) -> Option<String> {
     inputs.into_iter().find(|n| usable(n.as_str()))
 }
 
+type SharedResampler = Arc<Mutex<FftFixedIn<f32>>>;
+
+/// Resamplers built so far, one per device rate. FFT planning is the costliest
+/// step of opening a capture, and the mic's rate rarely changes between
+/// dictations, so each press after the first reuses the previous one.
+static RESAMPLERS: Mutex<Vec<(u32, SharedResampler)>> = Mutex::new(Vec::new());
+
 /// Create a resampler from device sample rate to 16kHz, if needed.
-pub fn create_resampler(device_sr: u32) -> Result<Option<Arc<Mutex<FftFixedIn<f32>>>>> {
+pub fn create_resampler(device_sr: u32) -> Result<Option<SharedResampler>> {
     if device_sr == SAMPLE_RATE {
         return Ok(None);
     }
-    let resampler = FftFixedIn::<f32>::new(
+    let mut cache = RESAMPLERS.lock_safe();
+    let slot = cache.iter().position(|(sr, _)| *sr == device_sr);
+    if let Some((_, r)) = slot.map(|i| &cache[i]) {
+        // Only hand it out again once the previous stream has let go of it
+        // (strong count 1 = just the cache); reset clears its filter history.
+        if Arc::strong_count(r) == 1 {
+            r.lock_safe().reset();
+            return Ok(Some(r.clone()));
+        }
+    }
+    let resampler = Arc::new(Mutex::new(FftFixedIn::<f32>::new(
         device_sr as usize,
         SAMPLE_RATE as usize,
         RESAMPLE_CHUNK_SIZE,
         1,
         1,
-    )?;
-    Ok(Some(Arc::new(Mutex::new(resampler))))
+    )?));
+    match slot {
+        Some(i) => cache[i].1 = resampler.clone(),
+        None => cache.push((device_sr, resampler.clone())),
+    }
+    Ok(Some(resampler))
 }
 
 /// Downmix interleaved multi-channel audio to mono.
@@ -222,6 +288,29 @@ pub fn downmix_into(data: &[f32], channels: usize, out: &mut Vec<f32>) {
     }
 }
 
+/// The voiced part of a recording: leading/trailing silence (typically the
+/// time the hotkey was held before and after speaking) is sliced off, keeping
+/// `TRIM_PAD` either side. Engine cost grows with the audio length, so this is
+/// free latency. Returns the input unchanged when nothing stands out.
+pub fn trim_silence(audio: &[f32]) -> &[f32] {
+    let frame_peak = |frame: &[f32]| frame.iter().fold(0.0f32, |m, s| m.max(s.abs()));
+    let mut peaks: Vec<f32> = audio.chunks(TRIM_FRAME).map(frame_peak).collect();
+    if peaks.is_empty() {
+        return audio;
+    }
+    let nth = peaks.len() * TRIM_NOISE_PERCENTILE / 100;
+    let (_, &mut floor, _) = peaks.select_nth_unstable_by(nth, f32::total_cmp);
+    let threshold = (floor * TRIM_NOISE_MARGIN).max(SPEECH_MIN_PEAK);
+    let voiced = |frame: &[f32]| frame_peak(frame) >= threshold;
+    let Some(first) = audio.chunks(TRIM_FRAME).position(voiced) else {
+        return audio;
+    };
+    let last = audio.chunks(TRIM_FRAME).rposition(voiced).unwrap_or(first);
+    let start = (first * TRIM_FRAME).saturating_sub(TRIM_PAD);
+    let end = ((last + 1) * TRIM_FRAME + TRIM_PAD).min(audio.len());
+    &audio[start..end]
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -256,6 +345,42 @@ mod tests {
         assert!(result.is_empty());
     }
 
+    #[test]
+    fn test_trim_silence_keeps_padded_voiced_region() {
+        let sr = SAMPLE_RATE as usize;
+        // 2 s silence, 1 s tone, 3 s silence.
+        let mut audio = vec![0.0f32; 6 * sr];
+        for s in &mut audio[2 * sr..3 * sr] {
+            *s = 0.5;
+        }
+        let trimmed = trim_silence(&audio);
+        assert_eq!(trimmed.len(), sr + 2 * TRIM_PAD);
+        assert!(trimmed[TRIM_PAD] > 0.0 && trimmed[trimmed.len() - TRIM_PAD - 1] > 0.0);
+    }
+
+    #[test]
+    fn test_trim_silence_keeps_soft_speech_next_to_a_click() {
+        let sr = SAMPLE_RATE as usize;
+        // 1 s silence, a full-scale click, 0.5 s gap, 1 s of soft speech
+        // (−34 dBFS), 1 s silence. The click must not push the speech under
+        // the threshold.
+        let mut audio = vec![0.0f32; 7 * sr / 2];
+        audio[sr] = 1.0;
+        for s in &mut audio[3 * sr / 2..5 * sr / 2] {
+            *s = 0.02;
+        }
+        let trimmed = trim_silence(&audio);
+        assert_eq!(trimmed.iter().filter(|&&s| s == 0.02).count(), sr);
+        assert!(trimmed.len() < audio.len());
+    }
+
+    #[test]
+    fn test_trim_silence_leaves_quiet_audio_alone() {
+        let audio = vec![0.001f32; SAMPLE_RATE as usize];
+        assert_eq!(trim_silence(&audio).len(), audio.len());
+        assert!(trim_silence(&[]).is_empty());
+    }
+
     #[test]
     fn test_constants() {
         assert_eq!(SAMPLE_RATE, 16_000);
@@ -275,6 +400,18 @@ mod tests {
         assert!(r.is_some());
     }
 
+    #[test]
+    fn test_create_resampler_reuses_released_instance() {
+        let first = create_resampler(22_050).unwrap().unwrap();
+        // Still held by a live stream → a separate instance.
+        let second = create_resampler(22_050).unwrap().unwrap();
+        assert!(!Arc::ptr_eq(&first, &second));
+        let ptr = Arc::as_ptr(&second);
+        drop((first, second));
+        let again = create_resampler(22_050).unwrap().unwrap();
+        assert_eq!(Arc::as_ptr(&again), ptr);
+    }
+
     #[test]
     fn test_is_builtin_mic() {
         assert!(is_builtin_mic("MacBook Pro Microphone"));
@@ -1,7 +1,7 @@
 use anyhow::Result;
 use cpal::traits::{DeviceTrait, HostTrait, StreamTrait};
 use std::sync::atomic::{AtomicBool, AtomicU64, AtomicUsize, Ordering};
-use std::sync::{Arc, Once, OnceLock, RwLock};
+use std::sync::{Arc, OnceLock, RwLock};
 use tracing::warn;
 
 /// Embedded sound files (compiled into the binary).
@@ -33,8 +33,8 @@ const KEEPWARM_WINDOW_SECS: u64 = 180;
 
 /// Unix-secs until which the output device is kept warm (0 = not armed).
 static WARM_UNTIL: AtomicU64 = AtomicU64::new(0);
-/// One-shot guard so the keep-warm thread is spawned at most once.
-static KEEPWARM_STARTED: Once = Once::new();
+/// The keep-warm thread, spawned at most once (`None` if the spawn failed).
+static KEEPWARM_THREAD: OnceLock<Option<std::thread::Thread>> = OnceLock::new();
 
 /// Selected output device name ("auto"/empty = system default). Set from config
 /// at startup and live when the user picks a device in the tray menu.
@@ -82,9 +82,12 @@ pub fn play_sound(name: &str) {
                 if let Some(path) = extracted_sound_path(name, wav_data, lead_ms, peak) {
                     // Loudness is baked into the file, so no `-v` (afplay's -v
                     // doesn't reliably amplify above 1.0 anyway).
-                    let _ = std::process::Command::new("/usr/bin/afplay")
+                    if let Ok(child) = std::process::Command::new("/usr/bin/afplay")
                         .arg(path)
-                        .spawn();
+                        .spawn()
+                    {
+                        track_afplay(child);
+                    }
                     return;
                 }
             }
@@ -92,15 +95,55 @@ pub fn play_sound(name: &str) {
     }
 
     // cpal path (non-macOS, or a macOS custom output device). Decode once, then
-    // play on a thread so the caller (the hot key-down path) never blocks.
-    let name = name.to_string();
-    std::thread::spawn(move || {
-        if let Some(samples) = decoded_samples(&name) {
-            if let Err(e) = play_samples(&samples, lead_ms) {
-                warn!("Sound playback error: {e}");
-            }
-        }
-    });
+    // play on the cue worker so the caller (the hot key-down path) never blocks.
+    if let Some(tx) = cue_tx() {
+        let _ = tx.send((name.to_string(), lead_ms));
+    }
+}
+
+/// The cpal cue player: one long-lived worker fed through a channel, rather than
+/// a fresh thread per cue (two per dictation, spawned on the key-down path). The
+/// cues are ~100 ms and a dictation's start/stop are seconds apart, so playing
+/// them in order never audibly delays one.
+fn cue_tx() -> Option<&'static crossbeam_channel::Sender<(String, u32)>> {
+    static TX: OnceLock<Option<crossbeam_channel::Sender<(String, u32)>>> = OnceLock::new();
+    TX.get_or_init(|| {
+        let (tx, rx) = crossbeam_channel::unbounded::<(String, u32)>();
+        std::thread::Builder::new()
+            .name("sound-cues".into())
+            .spawn(move || {
+                for (name, lead_ms) in rx {
+                    // Contain a playback panic so one bad cue doesn't silence
+                    // every later one for the rest of the session.
+                    let _ = std::panic::catch_unwind(|| {
+                        if let Some(samples) = decoded_samples(&name) {
+                            if let Err(e) = play_samples(&samples, lead_ms) {
+                                warn!("Sound playback error: {e}");
+                            }
+                        }
+                    });
+                }
+            })
+            .ok()?;
+        Some(tx)
+    })
+    .as_ref()
+}
+
+/// `afplay` processes we spawned and haven't reaped yet. A dropped `Child` is
+/// never waited on, so every cue used to leave a zombie behind for the life of
+/// the daemon (two per dictation). Finished ones are collected on the next
+/// play — no waiter thread per sound.
+#[cfg(target_os = "macos")]
+static AFPLAY_CHILDREN: std::sync::Mutex<Vec<std::process::Child>> =
+    std::sync::Mutex::new(Vec::new());
+
+#[cfg(target_os = "macos")]
+fn track_afplay(child: std::process::Child) {
+    use crate::util::LockSafe;
+    let mut children = AFPLAY_CHILDREN.lock_safe();
+    children.retain_mut(|c| matches!(c.try_wait(), Ok(None)));
+    children.push(child);
 }
 
 // ─── Output keep-warm ────────────────────────────────────────────────────────
@@ -119,13 +162,16 @@ fn arm_keepwarm() {
         crate::util::now_secs() + KEEPWARM_WINDOW_SECS,
         Ordering::Relaxed,
     );
-    KEEPWARM_STARTED.call_once(spawn_keepwarm_thread);
+    if let Some(t) = KEEPWARM_THREAD.get_or_init(spawn_keepwarm_thread) {
+        t.unpark();
+    }
 }
 
 /// Worker: holds a silent output stream open while armed, drops it when the
 /// window lapses. The `cpal::Stream` is `!Send`, so it's created, held, and
-/// dropped entirely on this one thread.
-fn spawn_keepwarm_thread() {
+/// dropped entirely on this one thread. Once released it parks until the next
+/// `arm_keepwarm` rather than waking every tick for nothing.
+fn spawn_keepwarm_thread() -> Option<std::thread::Thread> {
     std::thread::Builder::new()
         .name("audio-keepwarm".into())
         .spawn(|| {
@@ -146,10 +192,15 @@ fn spawn_keepwarm_thread() {
                     stream = None; // drop → release the device so the DAC can sleep
                     dev.clear();
                 }
-                std::thread::sleep(std::time::Duration::from_secs(2));
+                if active {
+                    std::thread::park_timeout(std::time::Duration::from_secs(2));
+                } else {
+                    std::thread::park();
+                }
             }
         })
-        .ok();
+        .ok()
+        .map(|h| h.thread().clone())
 }
 
 /// A running output stream that emits pure silence — just enough to keep the
@@ -187,6 +238,12 @@ fn output_device(selected: &str) -> Option<cpal::Device> {
     }
 }
 
+/// afplay clips already written/verified this session, keyed by (name, lead_ms)
+/// — the peak is fixed per name. `play_sound` runs on the key-down path, so a
+/// hit skips the `data_dir()` lookup and the per-play `exists()` stat entirely.
+#[cfg(target_os = "macos")]
+static EXTRACTED: RwLock<Vec<(String, u32, std::path::PathBuf)>> = RwLock::new(Vec::new());
+
 /// Path to the cached afplay clip for `name`, normalised to `peak` and carrying
 /// `lead_ms` of leading silence. Built once per (lead, peak) combination.
 #[cfg(target_os = "macos")]
@@ -196,6 +253,11 @@ fn extracted_sound_path(
     lead_ms: u32,
     peak: f32,
 ) -> Option<std::path::PathBuf> {
+    if let Ok(known) = EXTRACTED.read() {
+        if let Some((_, _, p)) = known.iter().find(|(n, l, _)| n == name && *l == lead_ms) {
+            return Some(p.clone());
+        }
+    }
     let dir = crate::config::data_dir().join("sounds");
     // Filename encodes lead + peak so a change (or an older un-normalised
     // extract) regenerates instead of replaying a stale file.
@@ -206,6 +268,9 @@ fn extracted_sound_path(
         let bytes = build_clip_wav(wav_data, lead_ms, peak).unwrap_or_else(|| wav_data.to_vec());
         std::fs::write(&path, bytes).ok()?;
     }
+    if let Ok(mut known) = EXTRACTED.write() {
+        known.push((name.to_string(), lead_ms, path.clone()));
+    }
     Some(path)
 }
 
@@ -305,6 +370,7 @@ fn play_samples(samples: &Arc<Vec<f32>>, lead_ms: u32) -> Result<()> {
     let done = Arc::new(AtomicBool::new(false));
     let done_clone = done.clone();
     let pos_clone = pos.clone();
+    let waiter = std::thread::current();
     let samples = samples.clone();
     let total = lead_frames + samples.len();
 
@@ -314,7 +380,10 @@ fn play_samples(samples: &Arc<Vec<f32>>, lead_ms: u32) -> Result<()> {
             for frame in output.chunks_mut(channels) {
                 let idx = pos_clone.fetch_add(1, Ordering::Relaxed);
                 let v = if idx >= total {
-                    done_clone.store(true, Ordering::Relaxed);
+                    // First frame past the end: wake the waiting thread.
+                    if !done_clone.swap(true, Ordering::Release) {
+                        waiter.unpark();
+                    }
                     0.0
                 } else if idx < lead_frames {
                     0.0 // lead-in silence
@@ -332,9 +401,10 @@ fn play_samples(samples: &Arc<Vec<f32>>, lead_ms: u32) -> Result<()> {
 
     stream.play()?;
 
-    // Wait for playback to complete
-    while !done.load(Ordering::Relaxed) {
-        std::thread::sleep(std::time::Duration::from_millis(10));
+    // Wait for playback to complete — parked until the callback signals the
+    // end, rather than polling (the loop absorbs spurious wake-ups).
+    while !done.load(Ordering::Acquire) {
+        std::thread::park();
     }
     // Small tail to ensure the last buffer is flushed
     std::thread::sleep(std::time::Duration::from_millis(50));
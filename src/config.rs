@@ -46,6 +46,10 @@ pub struct Config {
     /// is loaded; system sleep pauses it. Default on; turn off to save battery at
     /// the cost of a slow first dictation after each idle gap.
     pub keep_model_resident: bool,
+    /// Toggle mode only: end the recording by itself once this many
+    /// milliseconds of silence follow speech, instead of waiting for the second
+    /// press. 0 = off (stop with the hotkey).
+    pub auto_stop_silence_ms: u64,
 }
 
 impl Default for Config {
@@ -67,6 +71,7 @@ impl Default for Config {
             online_enrichment: false,
             overlay_enabled: true,
             keep_model_resident: true,
+            auto_stop_silence_ms: 0,
         }
     }
 }
@@ -79,12 +84,18 @@ impl Config {
     /// rather than propagating the parse error and refusing to boot.
     pub fn load() -> Result<Self> {
         let path = config_path();
-        if !path.exists() {
-            let cfg = Self::default();
-            cfg.save()?;
-            return Ok(cfg);
-        }
-        match Self::load_from(&path) {
+        // Read straight away and treat NotFound as "first run" — no separate
+        // exists() probe ahead of the read.
+        let parsed = match std::fs::read_to_string(&path) {
+            Ok(content) => Self::parse(&content),
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                let cfg = Self::default();
+                cfg.save()?;
+                return Ok(cfg);
+            }
+            Err(e) => Err(e.into()),
+        };
+        match parsed {
             Ok(cfg) => Ok(cfg),
             Err(e) => {
                 tracing::error!("config.toml unreadable ({e}); backing up to .bad, using defaults");
@@ -98,9 +109,11 @@ impl Config {
 
     /// Load config from a specific file.
     pub fn load_from(path: &Path) -> Result<Self> {
-        let content = std::fs::read_to_string(path)?;
-        let cfg: Self = toml::from_str(&content)?;
-        Ok(cfg)
+        Self::parse(&std::fs::read_to_string(path)?)
+    }
+
+    fn parse(content: &str) -> Result<Self> {
+        Ok(toml::from_str(content)?)
     }
 
     /// Save config to the platform-default path. Written atomically (tmp file +
@@ -180,6 +193,7 @@ mod tests {
         assert!(!cfg.debug);
         assert!(!cfg.auto_start);
         assert!(cfg.keep_model_resident);
+        assert_eq!(cfg.auto_stop_silence_ms, 0);
     }
 
     #[test]
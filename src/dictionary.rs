@@ -69,7 +69,7 @@ use std::sync::Mutex;
 use std::sync::atomic::{AtomicBool, Ordering};
 
 /// Set when the dictionary changed off the UI thread (auto-capture), so the
-/// tray can refresh its word list on its next tick.
+/// tray can refresh its word list (the setter wakes the tray's run loop).
 static MENU_DIRTY: AtomicBool = AtomicBool::new(false);
 
 /// Baseline of the focused field right after the last paste, plus the dictation
@@ -111,7 +111,7 @@ const POLL_TICKS: u32 = 20;
 /// Reset on each arm.
 static LAST_POLLED: Mutex<Option<String>> = Mutex::new(None);
 
-/// Take-and-clear the "menu needs refreshing" flag (polled by the tray).
+/// Take-and-clear the "menu needs refreshing" flag (checked by the tray).
 pub fn take_menu_dirty() -> bool {
     MENU_DIRTY.swap(false, Ordering::Relaxed)
 }
@@ -243,6 +243,10 @@ fn looks_like_edit(baseline: &str, current: &str) -> bool {
 pub fn capture_pending_correction() {
     #[cfg(target_os = "macos")]
     {
+        // Nothing armed (or already captured): skip the Accessibility read.
+        if PENDING.lock_safe().is_none() {
+            return;
+        }
         let Some(current) = ax::focused_text() else {
             tracing::info!("auto-capture: can't read the field now — skipped");
             // Drop the pending snapshot: we can't diff against it.
@@ -336,6 +340,7 @@ pub fn capture_with_current(current: &str) {
                 crate::acoustic::learn_word(heard, term);
             }
             MENU_DIRTY.store(true, Ordering::Relaxed);
+            crate::tray::wake_main();
             let n = report.learned.len();
             crate::notify::app(&format!(
                 "Learned {n} word{} from your correction",
@@ -1,5 +1,6 @@
 //! Hardware detection — identify GPU, recommend best transcription engine.
 
+use std::sync::OnceLock;
 use tracing::info;
 
 #[derive(Debug, Clone)]
@@ -35,15 +36,23 @@ impl GpuInfo {
 }
 
 /// Detect hardware and recommend the best engine.
+///
+/// The probe shells out (nvidia-smi, vulkaninfo, sysctl), so the result is
+/// computed once per process and cloned for later callers.
 pub fn detect() -> HardwareInfo {
-    let gpu = detect_gpu();
-    let info = HardwareInfo {
-        os: std::env::consts::OS,
-        arch: std::env::consts::ARCH,
-        gpu,
-    };
-    info!("Hardware: {} {} — GPU: {:?}", info.os, info.arch, info.gpu);
-    info
+    static DETECTED: OnceLock<HardwareInfo> = OnceLock::new();
+    DETECTED
+        .get_or_init(|| {
+            let gpu = detect_gpu();
+            let info = HardwareInfo {
+                os: std::env::consts::OS,
+                arch: std::env::consts::ARCH,
+                gpu,
+            };
+            info!("Hardware: {} {} — GPU: {:?}", info.os, info.arch, info.gpu);
+            info
+        })
+        .clone()
 }
 
 /// Recommend the best backend based on hardware.
@@ -94,6 +94,7 @@ pub fn record(text: &str) {
     }
     let _ = std::fs::write(&path, format!("{snapshot}\n"));
     DIRTY.store(true, Ordering::Relaxed);
+    crate::tray::wake_main();
 }
 
 /// Recent runs, newest first (at most [`MAX_ENTRIES`]).
@@ -107,9 +108,11 @@ pub fn clear() {
     ENTRIES.lock_safe().clear();
     let _ = std::fs::remove_file(file_path());
     DIRTY.store(true, Ordering::Relaxed);
+    crate::tray::wake_main();
 }
 
-/// True at most once per change — the tray polls this to refresh its submenu.
+/// True at most once per change — the tray checks this (woken by the change)
+/// to refresh its submenu.
 pub fn take_dirty() -> bool {
     DIRTY.swap(false, Ordering::Relaxed)
 }
@@ -2,25 +2,24 @@ use crate::state::Event;
 use crate::util::LockSafe;
 use core_foundation::base::TCFType;
 use crossbeam_channel::Sender;
-use std::cell::Cell;
 use std::ffi::c_void;
 use std::sync::Mutex;
-use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::atomic::{AtomicBool, AtomicPtr, AtomicU64, Ordering};
 use tracing::{debug, info};
 
 // CGEvent types
 const K_CG_EVENT_FLAGS_CHANGED: u32 = 12;
 const K_CG_EVENT_KEY_DOWN: u32 = 10;
 
-thread_local! {
-    /// Raw mach-port of the live CGEventTap, so its callback can re-enable it
-    /// when macOS disables the tap (after a timeout or on wake-from-sleep) —
-    /// otherwise the hotkey silently dies after long uptime / sleep.
-    static TAP_PORT: Cell<*const c_void> = const { Cell::new(std::ptr::null()) };
-}
+/// Raw mach-port of the live CGEventTap, so its callback can re-enable it when
+/// macOS disables the tap (after a timeout or on wake-from-sleep) — otherwise
+/// the hotkey silently dies after long uptime / sleep — and so `stop` can take
+/// the tap off the event path at quit. The `CGEventTap` itself stays owned by
+/// the tap thread for the life of the process.
+static TAP_PORT: AtomicPtr<c_void> = AtomicPtr::new(std::ptr::null_mut());
 
 unsafe extern "C" {
-    fn CGEventTapEnable(tap: *const c_void, enable: bool);
+    fn CGEventTapEnable(tap: *mut c_void, enable: bool);
 }
 
 // Modifier flags in CGEventFlags
@@ -28,6 +27,10 @@ const CG_EVENT_FLAG_CONTROL: u64 = 1 << 18;
 const CG_EVENT_FLAG_SHIFT: u64 = 1 << 17;
 const CG_EVENT_FLAG_ALTERNATE: u64 = 1 << 19;
 const CG_EVENT_FLAG_COMMAND: u64 = 1 << 20;
+/// The four modifiers a hotkey can name; everything else in CGEventFlags
+/// (caps lock, fn, numeric pad, device-specific bits) is ignored when matching.
+const CG_EVENT_MODIFIER_MASK: u64 =
+    CG_EVENT_FLAG_CONTROL | CG_EVENT_FLAG_SHIFT | CG_EVENT_FLAG_ALTERNATE | CG_EVENT_FLAG_COMMAND;
 
 const KEYCODE_LCTRL: i64 = 59;
 const KEYCODE_RCTRL: i64 = 62;
@@ -103,6 +106,17 @@ const MODIFIERS: &[(i64, u64, &str)] = &[
     (KEYCODE_RCMD, CG_EVENT_FLAG_COMMAND, "rcmd"),
 ];
 
+/// Either-side modifier names (and their aliases) → flag.
+const GENERIC_MODIFIERS: &[(&str, u64)] = &[
+    ("cmd", CG_EVENT_FLAG_COMMAND),
+    ("command", CG_EVENT_FLAG_COMMAND),
+    ("shift", CG_EVENT_FLAG_SHIFT),
+    ("alt", CG_EVENT_FLAG_ALTERNATE),
+    ("option", CG_EVENT_FLAG_ALTERNATE),
+    ("ctrl", CG_EVENT_FLAG_CONTROL),
+    ("control", CG_EVENT_FLAG_CONTROL),
+];
+
 fn modifier_by_keycode(code: i64) -> Option<(u64, &'static str)> {
     MODIFIERS
         .iter()
@@ -136,6 +150,36 @@ pub(crate) struct MatchConfig {
     pub(crate) is_hold: bool,
 }
 
+impl MatchConfig {
+    // Packed layout: modifier flags keep their CGEventFlags bits (17..=20), the
+    // two keycodes (< 128) sit +1 in the low bytes so 0 means "none", bit 16 is
+    // the mode and bit 63 marks a bound hotkey.
+    const PACKED_HOLD: u64 = 1 << 16;
+    const PACKED_BOUND: u64 = 1 << 63;
+
+    fn pack(self) -> u64 {
+        let code = |c: Option<i64>| c.map_or(0, |c| (c as u64 & 0x7f) + 1);
+        Self::PACKED_BOUND
+            | (self.modifier_flags & CG_EVENT_MODIFIER_MASK)
+            | code(self.key_code)
+            | code(self.modifier_keycode) << 8
+            | if self.is_hold { Self::PACKED_HOLD } else { 0 }
+    }
+
+    fn unpack(packed: u64) -> Option<Self> {
+        if packed & Self::PACKED_BOUND == 0 {
+            return None;
+        }
+        let code = |b: u64| b.checked_sub(1).map(|c| c as i64);
+        Some(MatchConfig {
+            modifier_flags: packed & CG_EVENT_MODIFIER_MASK,
+            key_code: code(packed & 0xff),
+            modifier_keycode: code(packed >> 8 & 0xff),
+            is_hold: packed & Self::PACKED_HOLD != 0,
+        })
+    }
+}
+
 pub(crate) fn parse_hotkey(hotkey: &str, mode: &str) -> MatchConfig {
     let mut flags: u64 = 0;
     let mut key_code: Option<i64> = None;
@@ -143,48 +187,13 @@ pub(crate) fn parse_hotkey(hotkey: &str, mode: &str) -> MatchConfig {
 
     for part in hotkey.to_lowercase().split('+') {
         let part = part.trim();
-        match part {
-            "cmd" | "command" => flags |= CG_EVENT_FLAG_COMMAND,
-            "shift" => flags |= CG_EVENT_FLAG_SHIFT,
-            "alt" | "option" => flags |= CG_EVENT_FLAG_ALTERNATE,
-            "ctrl" | "control" => flags |= CG_EVENT_FLAG_CONTROL,
-            "lctrl" => {
-                modifier_keycode = Some(KEYCODE_LCTRL);
-                flags |= CG_EVENT_FLAG_CONTROL;
-            }
-            "rctrl" => {
-                modifier_keycode = Some(KEYCODE_RCTRL);
-                flags |= CG_EVENT_FLAG_CONTROL;
-            }
-            "lshift" => {
-                modifier_keycode = Some(KEYCODE_LSHIFT);
-                flags |= CG_EVENT_FLAG_SHIFT;
-            }
-            "rshift" => {
-                modifier_keycode = Some(KEYCODE_RSHIFT);
-                flags |= CG_EVENT_FLAG_SHIFT;
-            }
-            "lalt" => {
-                modifier_keycode = Some(KEYCODE_LALT);
-                flags |= CG_EVENT_FLAG_ALTERNATE;
-            }
-            "ralt" => {
-                modifier_keycode = Some(KEYCODE_RALT);
-                flags |= CG_EVENT_FLAG_ALTERNATE;
-            }
-            "lcmd" => {
-                modifier_keycode = Some(KEYCODE_LCMD);
-                flags |= CG_EVENT_FLAG_COMMAND;
-            }
-            "rcmd" => {
-                modifier_keycode = Some(KEYCODE_RCMD);
-                flags |= CG_EVENT_FLAG_COMMAND;
-            }
-            other => {
-                if let Some(c) = key_name_to_code(other) {
-                    key_code = Some(c);
-                }
-            }
+        if let Some((_, f)) = GENERIC_MODIFIERS.iter().find(|(n, _)| *n == part) {
+            flags |= f;
+        } else if let Some((kc, f, _)) = MODIFIERS.iter().find(|(_, _, n)| *n == part) {
+            modifier_keycode = Some(*kc);
+            flags |= f;
+        } else if let Some(c) = key_name_to_code(part) {
+            key_code = Some(c);
         }
     }
     MatchConfig {
@@ -195,21 +204,56 @@ pub(crate) fn parse_hotkey(hotkey: &str, mode: &str) -> MatchConfig {
     }
 }
 
-// Live, mutable state shared with the running event tap.
-static MATCH_CFG: Mutex<Option<MatchConfig>> = Mutex::new(None);
+/// True when a KeyDown is exactly the configured toggle chord. Extra modifiers
+/// don't match: the tap swallows what it matches, so Cmd+Shift+Ctrl+Space must
+/// still reach the focused app when the hotkey is Cmd+Shift+Space.
+fn is_toggle_chord(cfg: &MatchConfig, key_code: i64, flags: u64) -> bool {
+    !cfg.is_hold
+        && cfg.key_code == Some(key_code)
+        && flags & CG_EVENT_MODIFIER_MASK == cfg.modifier_flags
+}
+
+/// Pre-filter on the event type + keycode alone: false means the event can't
+/// concern the hotkey in any state, so the tap passes it through without
+/// reading the rest of the event. Nearly every keystroke takes this exit.
+fn may_concern(cfg: &MatchConfig, event_type: u32, key_code: i64, hold_active: bool) -> bool {
+    match (event_type, cfg.is_hold) {
+        (K_CG_EVENT_FLAGS_CHANGED, true) => cfg.modifier_keycode.is_none_or(|m| m == key_code),
+        // Any key during a hold cancels it; outside a hold KeyDowns are inert.
+        (K_CG_EVENT_KEY_DOWN, true) => hold_active,
+        (K_CG_EVENT_KEY_DOWN, false) => cfg.key_code == Some(key_code),
+        _ => false,
+    }
+}
+
+// Live, mutable state shared with the running event tap. The hotkey is packed
+// into one word so the tap callback (every keystroke, system-wide) reads it with
+// a single atomic load instead of taking a lock.
+static MATCH_CFG: AtomicU64 = AtomicU64::new(0);
 static CAPTURING: AtomicBool = AtomicBool::new(false);
 // Modifier seen going down during capture (keycode) — confirms a "hold" hotkey
 // only once it is released with no other key pressed in between.
 static CAPTURE_PENDING_MOD: Mutex<Option<i64>> = Mutex::new(None);
 // Where to deliver a captured hotkey (the main tray channel, not the pipeline).
+// Held only while capture is armed.
 static CAPTURE_TX: Mutex<Option<Sender<Event>>> = Mutex::new(None);
 
 /// Apply a new hotkey to the running tap immediately (no restart).
 pub fn rebind(hotkey: &str, mode: &str) {
-    *MATCH_CFG.lock_safe() = Some(parse_hotkey(hotkey, mode));
+    MATCH_CFG.store(parse_hotkey(hotkey, mode).pack(), Ordering::Release);
     info!("Hotkey rebound: '{hotkey}' ({mode})");
 }
 
+/// Disable the event tap ahead of process exit. It is an active tap, so the
+/// window server routes every keystroke through it; taking it off the event
+/// path first means keyboard input never waits on a process that is quitting.
+pub fn stop() {
+    let port = TAP_PORT.swap(std::ptr::null_mut(), Ordering::AcqRel);
+    if !port.is_null() {
+        unsafe { CGEventTapEnable(port, false) };
+    }
+}
+
 /// Arm capture of the next key combo. `tx` is the channel that receives the
 /// resulting `Event::HotkeyCaptured`.
 pub fn start_capture(tx: Sender<Event>) {
@@ -290,6 +334,17 @@ mod tests {
         assert_eq!(hk.modifier_keycode, Some(KEYCODE_RCMD));
     }
 
+    #[test]
+    fn test_parse_hotkey_aliases() {
+        let hk = parse_hotkey("Command+Option+Control+Space", "toggle");
+        assert_eq!(
+            hk.modifier_flags,
+            CG_EVENT_FLAG_COMMAND | CG_EVENT_FLAG_ALTERNATE | CG_EVENT_FLAG_CONTROL
+        );
+        assert_eq!(hk.key_code, Some(49));
+        assert!(hk.modifier_keycode.is_none());
+    }
+
     #[test]
     fn test_parse_hotkey_unknown_gives_zero_flags() {
         let hk = parse_hotkey("unknown", "hold");
@@ -297,6 +352,59 @@ mod tests {
         assert!(hk.key_code.is_none());
         assert!(hk.modifier_keycode.is_none());
     }
+
+    #[test]
+    fn test_match_config_pack_roundtrip() {
+        for (hotkey, mode) in [
+            ("cmd+shift+space", "toggle"),
+            ("rctrl", "hold"),
+            ("ctrl+alt+a", "toggle"),
+            ("unknown", "hold"),
+        ] {
+            let hk = parse_hotkey(hotkey, mode);
+            let back = MatchConfig::unpack(hk.pack()).expect("bound");
+            assert_eq!(back.modifier_flags, hk.modifier_flags);
+            assert_eq!(back.key_code, hk.key_code);
+            assert_eq!(back.modifier_keycode, hk.modifier_keycode);
+            assert_eq!(back.is_hold, hk.is_hold);
+        }
+        // "a" is keycode 0 — must not collapse into "no key".
+        assert_eq!(
+            MatchConfig::unpack(parse_hotkey("cmd+a", "toggle").pack())
+                .unwrap()
+                .key_code,
+            Some(0)
+        );
+        assert!(MatchConfig::unpack(0).is_none());
+    }
+
+    #[test]
+    fn test_toggle_chord_is_exact_on_modifiers() {
+        let hk = parse_hotkey("cmd+shift+space", "toggle");
+        let cmd_shift = CG_EVENT_FLAG_COMMAND | CG_EVENT_FLAG_SHIFT;
+        assert!(is_toggle_chord(&hk, 49, cmd_shift));
+        // Caps lock (1 << 16) is not a hotkey modifier and must not matter.
+        assert!(is_toggle_chord(&hk, 49, cmd_shift | 1 << 16));
+        assert!(!is_toggle_chord(&hk, 49, cmd_shift | CG_EVENT_FLAG_CONTROL));
+        assert!(!is_toggle_chord(&hk, 49, CG_EVENT_FLAG_COMMAND));
+        assert!(!is_toggle_chord(&hk, 36, cmd_shift));
+        let hold = parse_hotkey("ctrl", "hold");
+        assert!(!is_toggle_chord(&hold, 49, CG_EVENT_FLAG_CONTROL));
+    }
+
+    #[test]
+    fn test_may_concern_prefilter() {
+        let (down, flags) = (K_CG_EVENT_KEY_DOWN, K_CG_EVENT_FLAGS_CHANGED);
+        let toggle = parse_hotkey("cmd+shift+space", "toggle");
+        assert!(may_concern(&toggle, down, 49, false));
+        assert!(!may_concern(&toggle, down, 0, false));
+        assert!(!may_concern(&toggle, flags, KEYCODE_LCMD, false));
+        let hold = parse_hotkey("rctrl", "hold");
+        assert!(may_concern(&hold, flags, KEYCODE_RCTRL, false));
+        assert!(!may_concern(&hold, flags, KEYCODE_LCTRL, false));
+        assert!(!may_concern(&hold, down, 0, false));
+        assert!(may_concern(&hold, down, 0, true));
+    }
 }
 
 /// Start global hotkey listener using CGEventTap (works from any thread).
@@ -315,7 +423,12 @@ pub fn start(hotkey: &str, mode: &str, tx: Sender<Event>) -> anyhow::Result<()>
         let tap = CGEventTap::new(
             CGEventTapLocation::HID,
             CGEventTapPlacement::HeadInsertEventTap,
-            CGEventTapOptions::ListenOnly,
+            // An active (Default) tap rather than ListenOnly so the toggle chord
+            // can be swallowed instead of also landing in the focused app (a
+            // stray space / shortcut). Everything else is passed through as-is,
+            // and the callback only does cheap compares + a channel send, so it
+            // never holds up keyboard delivery.
+            CGEventTapOptions::Default,
             vec![CGEventType::FlagsChanged, CGEventType::KeyDown],
             |_proxy, event_type, event| {
                 // A panic here would unwind across the CoreGraphics/CFRunLoop C
@@ -330,7 +443,7 @@ pub fn start(hotkey: &str, mode: &str, tx: Sender<Event>) -> anyhow::Result<()>
                         event_type,
                         CGEventType::TapDisabledByTimeout | CGEventType::TapDisabledByUserInput
                     ) {
-                        let port = TAP_PORT.with(|p| p.get());
+                        let port = TAP_PORT.load(Ordering::Acquire);
                         if !port.is_null() {
                             unsafe { CGEventTapEnable(port, true) };
                             info!("hotkey tap was disabled by the system — re-enabled");
@@ -351,41 +464,60 @@ pub fn start(hotkey: &str, mode: &str, tx: Sender<Event>) -> anyhow::Result<()>
                         CGEventType::KeyDown => K_CG_EVENT_KEY_DOWN,
                         _ => return None,
                     };
-                    // Drop OS key auto-repeat: holding a non-modifier hotkey would
-                    // otherwise fire a storm of KeyDown events (repeated toggles /
-                    // start-sounds, icon flapping). Modifiers don't auto-repeat, so
-                    // hold-mode FlagsChanged is unaffected.
-                    if matches!(event_type, CGEventType::KeyDown)
-                        && event.get_integer_value_field(
-                            core_graphics::event::EventField::KEYBOARD_EVENT_AUTOREPEAT,
-                        ) != 0
-                    {
-                        return None;
-                    }
                     let kc = event.get_integer_value_field(
                         core_graphics::event::EventField::KEYBOARD_EVENT_KEYCODE,
                     );
+                    let capturing = CAPTURING.load(Ordering::SeqCst);
+                    let cfg = MatchConfig::unpack(MATCH_CFG.load(Ordering::Acquire));
+                    // Outside capture, bail before the remaining field reads
+                    // (each one a CoreGraphics call) for unrelated keystrokes.
+                    if !capturing {
+                        let hold = hold_active.load(std::sync::atomic::Ordering::Relaxed);
+                        if !cfg.is_some_and(|c| may_concern(&c, raw_type, kc, hold)) {
+                            return None;
+                        }
+                    }
+                    let is_repeat = matches!(event_type, CGEventType::KeyDown)
+                        && event.get_integer_value_field(
+                            core_graphics::event::EventField::KEYBOARD_EVENT_AUTOREPEAT,
+                        ) != 0;
                     let flags = event.get_flags().bits();
 
                     // Capture mode intercepts everything.
-                    if CAPTURING.load(Ordering::SeqCst) {
+                    if capturing {
+                        if is_repeat {
+                            return None;
+                        }
                         if let Some((hk, m)) = try_capture(raw_type, kc, flags) {
                             CAPTURING.store(false, Ordering::SeqCst);
                             rebind(&hk, &m);
                             hold_active.store(false, std::sync::atomic::Ordering::Relaxed);
-                            if let Some(tx) = CAPTURE_TX.lock_safe().as_ref() {
+                            // One capture per arm: drop our sender once it has
+                            // delivered, rather than pinning the channel forever.
+                            if let Some(tx) = CAPTURE_TX.lock_safe().take() {
                                 let _ = tx.send(Event::HotkeyCaptured(hk, m));
                             }
                         }
                         return None;
                     }
 
-                    let cfg = match *MATCH_CFG.lock_safe() {
-                        Some(c) => c,
-                        None => return None,
+                    let Some(cfg) = cfg else {
+                        return None;
                     };
                     let expected_flags = cfg.modifier_flags;
 
+                    // Drop OS key auto-repeat: holding a non-modifier hotkey would
+                    // otherwise fire a storm of KeyDown events (repeated toggles /
+                    // start-sounds, icon flapping). Modifiers don't auto-repeat, so
+                    // hold-mode FlagsChanged is unaffected. Repeats of the toggle
+                    // chord are still swallowed, like its first press.
+                    if is_repeat {
+                        if is_toggle_chord(&cfg, kc, flags) {
+                            event.set_type(CGEventType::Null);
+                        }
+                        return None;
+                    }
+
                     match raw_type {
                         K_CG_EVENT_FLAGS_CHANGED if cfg.is_hold => {
                             if let Some(expected_kc) = cfg.modifier_keycode {
@@ -416,16 +548,16 @@ pub fn start(hotkey: &str, mode: &str, tx: Sender<Event>) -> anyhow::Result<()>
                             }
                         }
                         K_CG_EVENT_KEY_DOWN => {
-                            if let Some(expected_kc) = cfg.key_code {
-                                if kc == expected_kc && (flags & expected_flags) == expected_flags {
-                                    info!("Toggle hotkey");
-                                    let _ = tx.send(Event::HotkeyToggle);
-                                }
+                            if is_toggle_chord(&cfg, kc, flags) {
+                                info!("Toggle hotkey");
+                                let _ = tx.send(Event::HotkeyToggle);
+                                // A Null-typed event is dropped by the window server.
+                                event.set_type(CGEventType::Null);
                             }
                         }
                         _ => {}
                     }
-                    None // ListenOnly — don't modify events
+                    None // pass the (possibly nulled) original event through
                 }))
                 .unwrap_or(None)
             },
@@ -449,7 +581,10 @@ pub fn start(hotkey: &str, mode: &str, tx: Sender<Event>) -> anyhow::Result<()>
 
         // Remember the tap's port so the callback can re-enable it if macOS
         // disables the tap (timeout / wake-from-sleep).
-        TAP_PORT.with(|p| p.set(tap.mach_port.as_concrete_TypeRef() as *const c_void));
+        TAP_PORT.store(
+            tap.mach_port.as_concrete_TypeRef() as *mut c_void,
+            Ordering::Release,
+        );
 
         info!("CGEventTap created — listening for hotkey events");
 
@@ -30,6 +30,13 @@ pub fn rebind(hotkey: &str, mode: &str) {
     macos::rebind(hotkey, mode);
 }
 
+/// Detach the listener before the process exits (macOS: disable the active
+/// event tap). No-op elsewhere — the hooks die with the process.
+pub fn stop_listener() {
+    #[cfg(target_os = "macos")]
+    macos::stop();
+}
+
 /// Arm capture of the next key combo; the result arrives as
 /// `Event::HotkeyCaptured` on `tx`. (macOS only for now.)
 #[allow(unused_variables)]
@@ -266,7 +266,9 @@ fn main() -> Result<()> {
 
     // Init logging with file output (after config is loaded so we know debug flag)
     init_logging(cfg.debug);
-    cleanup_old_logs();
+    // Housekeeping only — keep the directory sweep off the cold-start path so
+    // it never delays the tray appearing at login.
+    std::thread::spawn(cleanup_old_logs);
 
     info!("whisper-push v{}", env!("CARGO_PKG_VERSION"));
 
@@ -416,6 +418,9 @@ mod doctor {
                 features.join(", ")
             }
         );
+        // What whisper.cpp itself resolved at build/run time (GPU backend, SIMD,
+        // BLAS) — the precision/kernel choice is its own, so show it as-is.
+        println!("whisper.cpp: {}", whisper_rs::print_system_info().trim());
 
         // Audio devices — enumeration is internally bounded (see
         // audio::list_devices / DEVICE_ENUM_TIMEOUT), so no wrapper needed here.
@@ -18,34 +18,41 @@ pub struct ModelInfo {
 /// model picker (`macos/Onboarding/Sources/ModelPickerView.swift`) — keep the
 /// two in sync (same names, labels, sizes).
 pub fn list_models() -> Vec<ModelInfo> {
+    // Runs on every menu rebuild: one listing of the models dir answers both
+    // Whisper checks, and the Parakeet marker is read once for both variants.
+    let on_disk: Vec<std::ffi::OsString> = std::fs::read_dir(models_dir())
+        .map(|rd| rd.filter_map(|e| e.ok().map(|e| e.file_name())).collect())
+        .unwrap_or_default();
+    let whisper_downloaded = |file: &str| on_disk.iter().any(|n| n == file);
+    let parakeet = parakeet_variant_on_disk();
     vec![
         ModelInfo {
             name: "parakeet-tdt-0.6b-v3-int8",
             label: "Parakeet TDT v3 (int8)",
             size_mb: 670,
             description: "Parakeet TDT 0.6B int8 — fastest + lightest, 25 EU languages",
-            is_downloaded: parakeet_variant_downloaded(true),
+            is_downloaded: parakeet.as_deref() == Some("int8"),
         },
         ModelInfo {
             name: "parakeet-tdt-0.6b-v3",
             label: "Parakeet TDT v3 (fp32)",
             size_mb: 2500,
             description: "Parakeet TDT 0.6B fp32 — highest accuracy, 25 EU languages",
-            is_downloaded: parakeet_variant_downloaded(false),
+            is_downloaded: parakeet.as_deref() == Some("fp32"),
         },
         ModelInfo {
             name: "ggml-small-q5_1.bin",
             label: "Whisper Small (q5)",
             size_mb: 181,
             description: "Whisper small Q5 — 99 languages, lightweight",
-            is_downloaded: whisper_model_path("ggml-small-q5_1.bin").exists(),
+            is_downloaded: whisper_downloaded("ggml-small-q5_1.bin"),
         },
         ModelInfo {
             name: "ggml-large-v3-turbo-q5_0.bin",
             label: "Whisper Turbo (q5)",
             size_mb: 550,
             description: "Whisper large-v3-turbo Q5 — 99 languages, ~1.2s/10s audio",
-            is_downloaded: whisper_model_path("ggml-large-v3-turbo-q5_0.bin").exists(),
+            is_downloaded: whisper_downloaded("ggml-large-v3-turbo-q5_0.bin"),
         },
         ModelInfo {
             name: "voxtral-q4.gguf",
@@ -57,23 +64,19 @@ pub fn list_models() -> Vec<ModelInfo> {
     ]
 }
 
-/// Is the requested Parakeet variant the one currently on disk? Both variants
+/// Which Parakeet variant is on disk ("int8" / "fp32"), if any. Both variants
 /// share `models/parakeet/` (same filenames); a `.variant` marker file records
 /// which is present (absent ⇒ legacy fp32 install). Mirrors the Swift check.
-fn parakeet_variant_downloaded(want_int8: bool) -> bool {
+fn parakeet_variant_on_disk() -> Option<String> {
     let dir = parakeet_model_dir();
     if !dir.join("vocab.txt").exists() {
-        return false;
-    }
-    let variant = std::fs::read_to_string(dir.join(".variant"))
-        .ok()
-        .map(|s| s.trim().to_string())
-        .unwrap_or_else(|| "fp32".into());
-    if want_int8 {
-        variant == "int8"
-    } else {
-        variant == "fp32"
+        return None;
     }
+    Some(
+        std::fs::read_to_string(dir.join(".variant"))
+            .map(|s| s.trim().to_string())
+            .unwrap_or_else(|_| "fp32".into()),
+    )
 }
 
 /// Look up a model by its `name` (config value).
@@ -93,8 +96,8 @@ pub fn print_status() {
     }
 }
 
-fn whisper_model_path(filename: &str) -> PathBuf {
-    crate::config::whisper_model_path(filename)
+fn models_dir() -> PathBuf {
+    crate::config::models_dir()
 }
 
 fn parakeet_model_dir() -> PathBuf {
@@ -121,6 +124,8 @@ pub fn model_for_backend(backend: &str) -> &'static str {
     match backend {
         "parakeet" => "parakeet-tdt-0.6b-v3-int8",
         "voxtral-local" => "voxtral-q4.gguf",
+        // Turbo already has the distilled 4-layer decoder and ships quantized
+        // (q5_0); distil-large-v3 would only add an English-only restriction.
         _ => "ggml-large-v3-turbo-q5_0.bin",
     }
 }
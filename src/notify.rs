@@ -28,17 +28,56 @@ pub fn send(title: &str, body: &str) {
 
     #[cfg(not(target_os = "macos"))]
     {
-        if let Err(e) = notify_rust::Notification::new()
-            .summary(title)
-            .body(body)
-            .appname("Whisper Push")
-            .show()
-        {
-            warn!("Notification failed: {e}");
-        }
+        // No worker (thread spawn failed): deliver inline rather than drop it.
+        let job = (title.to_string(), body.to_string());
+        let job = match notify_tx() {
+            Some(tx) => match tx.send(job) {
+                Ok(()) => return,
+                Err(e) => e.into_inner(),
+            },
+            None => job,
+        };
+        show_desktop(&job.0, &job.1);
+    }
+}
+
+/// Deliver one desktop notification (D-Bus / WinRT). Blocks until the
+/// notification server answers.
+#[cfg(not(target_os = "macos"))]
+fn show_desktop(title: &str, body: &str) {
+    if let Err(e) = notify_rust::Notification::new()
+        .summary(title)
+        .body(body)
+        .appname("Whisper Push")
+        .show()
+    {
+        warn!("Notification failed: {e}");
     }
 }
 
+/// Desktop notifications go through one long-lived worker: `show()` is a
+/// synchronous round-trip to the notification server (a D-Bus call that waits
+/// out its timeout when no server is running), and callers include the pipeline
+/// thread — which must not stall behind it.
+#[cfg(not(target_os = "macos"))]
+fn notify_tx() -> Option<&'static crossbeam_channel::Sender<(String, String)>> {
+    use std::sync::OnceLock;
+    static TX: OnceLock<Option<crossbeam_channel::Sender<(String, String)>>> = OnceLock::new();
+    TX.get_or_init(|| {
+        let (tx, rx) = crossbeam_channel::unbounded::<(String, String)>();
+        std::thread::Builder::new()
+            .name("notify".into())
+            .spawn(move || {
+                for (title, body) in rx {
+                    let _ = std::panic::catch_unwind(|| show_desktop(&title, &body));
+                }
+            })
+            .ok()?;
+        Some(tx)
+    })
+    .as_ref()
+}
+
 /// Send a notification carrying a single action button. Clicking the button — or
 /// the notification body — runs `action`. macOS only for the button; elsewhere it
 /// degrades to a plain notification. `action` is a bare `fn()` (no captures) so it
@@ -75,19 +114,12 @@ fn macos_notify(title: &str, body: &str, action: Option<(&str, fn())>) -> bool {
     use objc2::runtime::AnyClass;
     use objc2_foundation::NSString;
 
-    unsafe {
-        // Check if we're in an app bundle (has a bundle identifier)
-        let bundle_cls = match AnyClass::get(c"NSBundle") {
-            Some(c) => c,
-            None => return false,
-        };
-        let main_bundle: Retained<objc2::runtime::AnyObject> = msg_send![bundle_cls, mainBundle];
-        let bundle_id: Option<Retained<NSString>> = msg_send![&main_bundle, bundleIdentifier];
-        if bundle_id.is_none() {
-            // Not in an app bundle — NSUserNotification won't show our icon
-            return false;
-        }
+    if !in_app_bundle() {
+        // Not in an app bundle — NSUserNotification won't show our icon
+        return false;
+    }
 
+    unsafe {
         let cls = match AnyClass::get(c"NSUserNotification") {
             Some(c) => c,
             None => return false,
@@ -128,6 +160,26 @@ fn macos_notify(title: &str, body: &str, action: Option<(&str, fn())>) -> bool {
     }
 }
 
+/// Whether we run from a .app bundle (has a bundle identifier). Fixed for the
+/// life of the process, so it's probed once rather than on every notification.
+#[cfg(target_os = "macos")]
+fn in_app_bundle() -> bool {
+    use objc2::msg_send;
+    use objc2::rc::Retained;
+    use objc2::runtime::AnyClass;
+    use objc2_foundation::NSString;
+
+    static IN_BUNDLE: std::sync::OnceLock<bool> = std::sync::OnceLock::new();
+    *IN_BUNDLE.get_or_init(|| unsafe {
+        let Some(bundle_cls) = AnyClass::get(c"NSBundle") else {
+            return false;
+        };
+        let main_bundle: Retained<objc2::runtime::AnyObject> = msg_send![bundle_cls, mainBundle];
+        let bundle_id: Option<Retained<NSString>> = msg_send![&main_bundle, bundleIdentifier];
+        bundle_id.is_some()
+    })
+}
+
 /// NSUserNotificationCenter delegate: catches notification activation (action
 /// button or body click) and runs the armed `fn()` off the main thread. The
 /// centre keeps only a weak delegate reference, so we hold the strong one here.
@@ -215,7 +267,7 @@ fn osascript_notify(title: &str, body: &str) {
         applescript_escape(body),
         applescript_escape(title),
     );
-    if let Err(e) = std::process::Command::new("osascript")
+    if let Err(e) = std::process::Command::new("/usr/bin/osascript")
         .arg("-e")
         .arg(&script)
         .stdout(std::process::Stdio::null())
@@ -78,7 +78,7 @@ mod macos {
     use objc2::rc::Retained;
     use objc2_app_kit::{
         NSBackingStoreType, NSBox, NSBoxType, NSColor, NSEvent, NSPanel, NSScreen, NSTitlePosition,
-        NSView, NSWindowCollectionBehavior, NSWindowStyleMask,
+        NSView, NSWindowCollectionBehavior, NSWindowOcclusionState, NSWindowStyleMask,
     };
     use objc2_foundation::{NSPoint, NSRect, NSSize, NSTimer};
     use std::cell::RefCell;
@@ -325,6 +325,17 @@ mod macos {
                 tracing::debug!("overlay: hidden");
                 return;
             }
+            // Fully occluded (screen locked, display asleep, covered by a
+            // full-screen app): nothing to paint, so skip the per-bar frame
+            // updates — each is a CoreAnimation transaction, 60×/s. The ease
+            // above still runs, so show/hide timing is unchanged.
+            if !p
+                .panel
+                .occlusionState()
+                .contains(NSWindowOcclusionState::Visible)
+            {
+                return;
+            }
             let s = p.appear; // current scale, 0..1
 
             // Whole pill scales from its centre (genie in/out). The panel stays
@@ -1,14 +1,24 @@
 use anyhow::Result;
+use std::panic::AssertUnwindSafe;
+use std::sync::OnceLock;
 use std::time::Duration;
 use tracing::{info, warn};
 
 // These delays sit on the critical path of *every* dictation (between text
 // ready and the user seeing it pasted), so they're tuned as low as still-
-// reliable. Trimmed from the original 50/150/100 (≈300 ms) → ≈180 ms.
-/// After putting our text on the clipboard, before firing Cmd/Ctrl+V — lets the
-/// pasteboard propagate. The OS clipboard is ready within a frame; 50 ms was
-/// mostly dead latency.
+// reliable. Trimmed from the original 50/150/100 (≈300 ms) → ≈180 ms, and
+// ≈160 ms on macOS, which needs no clipboard settle at all.
+/// After putting our text on the clipboard, before firing Ctrl+V — lets the
+/// X11/Wayland/Windows clipboard owner propagate. An upper bound: we fire as
+/// soon as the clipboard reads our text back (`await_clipboard`), which is
+/// usually the first check. Not used on macOS: an NSPasteboard write is
+/// synchronous (its change count has already moved when `set_text` returns),
+/// so Cmd+V can fire immediately.
+#[cfg(not(target_os = "macos"))]
 const CLIPBOARD_SETTLE: Duration = Duration::from_millis(20);
+/// Re-check interval while waiting out `CLIPBOARD_SETTLE`.
+#[cfg(not(target_os = "macos"))]
+const CLIPBOARD_POLL: Duration = Duration::from_millis(2);
 /// After firing paste, before touching the clipboard again — lets the target app
 /// consume the paste.
 const PASTE_CONSUME: Duration = Duration::from_millis(120);
@@ -16,9 +26,109 @@ const PASTE_CONSUME: Duration = Duration::from_millis(120);
 /// can't race the paste the app just read.
 const RESTORE_SETTLE: Duration = Duration::from_millis(40);
 
+/// Work for the paste worker, handled strictly in order.
+enum PasteJob {
+    /// A dictation is being transcribed: settle the previous one's pending
+    /// auto-capture now, in parallel, instead of at the start of its paste.
+    Prepare,
+    Paste(String),
+}
+
+/// The paste worker's queue, spawned on first use. `None` if the thread
+/// couldn't be started — callers then do the work inline.
+fn worker() -> Option<&'static crossbeam_channel::Sender<PasteJob>> {
+    static TX: OnceLock<Option<crossbeam_channel::Sender<PasteJob>>> = OnceLock::new();
+    TX.get_or_init(|| {
+        let (tx, rx) = crossbeam_channel::unbounded::<PasteJob>();
+        std::thread::Builder::new()
+            .name("paste".into())
+            .spawn(move || {
+                crate::util::set_thread_user_initiated();
+                // One clipboard handle for the worker's lifetime instead of one
+                // per paste (on X11, dropping a handle that owns the selection
+                // can block on the hand-off to the clipboard manager).
+                let mut clipboard = None;
+                while let Ok(job) = rx.recv() {
+                    let mut text = match job {
+                        PasteJob::Prepare => {
+                            let _ = std::panic::catch_unwind(
+                                crate::dictionary::capture_pending_correction,
+                            );
+                            continue;
+                        }
+                        PasteJob::Paste(text) => text,
+                    };
+                    // Dictations that queued up behind a slow paste go out as
+                    // one: a single clipboard round-trip and consume/restore
+                    // wait instead of one each. Successive pastes land
+                    // back-to-back anyway, so the concatenation is the same text.
+                    // (A queued `Prepare` is moot: the paste captures first.)
+                    for more in rx.try_iter() {
+                        if let PasteJob::Paste(more) = more {
+                            text.push_str(&more);
+                        }
+                    }
+                    // Contain a panic so one bad paste doesn't end all later ones.
+                    let pasted = std::panic::catch_unwind(AssertUnwindSafe(|| {
+                        paste_held(&mut clipboard, &text)
+                    }));
+                    match pasted {
+                        Ok(Ok(())) => continue,
+                        Ok(Err(e)) => tracing::error!("Paste failed: {e}"),
+                        Err(_) => tracing::error!("Paste panicked"),
+                    }
+                    // Reopen the clipboard next time rather than reuse a handle
+                    // that just failed.
+                    clipboard = None;
+                }
+            })
+            .ok()?;
+        Some(tx)
+    })
+    .as_ref()
+}
+
+/// Call when a dictation's transcription starts: the previous dictation's
+/// pending auto-capture (an Accessibility read of the field + learning) then
+/// runs on the paste worker alongside the transcription, rather than between
+/// the text being ready and Cmd+V. Without a worker the paste does it, as before.
+pub fn prepare_paste() {
+    if let Some(tx) = worker() {
+        let _ = tx.send(PasteJob::Prepare);
+    }
+}
+
+/// Queue `text` for pasting and return immediately. Pastes run in order on one
+/// worker thread, so the consume/restore waits after each Cmd+V no longer hold
+/// the pipeline (and with it the next dictation) back, and a paste can never
+/// interleave with the previous one's clipboard restore. Texts still waiting
+/// when the worker frees up are pasted together, in order.
+pub fn paste_text_queued(text: String) {
+    // No worker (thread spawn failed): paste inline rather than drop the text.
+    let text = match worker() {
+        Some(tx) => match tx.send(PasteJob::Paste(text)) {
+            Ok(()) => return,
+            Err(e) => match e.into_inner() {
+                PasteJob::Paste(text) => text,
+                PasteJob::Prepare => return,
+            },
+        },
+        None => text,
+    };
+    if let Err(e) = paste_text(&text) {
+        tracing::error!("Paste failed: {e}");
+    }
+}
+
 /// Paste text at the cursor position.
 /// Saves clipboard → sets text → simulates Cmd/Ctrl+V → restores clipboard.
 pub fn paste_text(text: &str) -> Result<()> {
+    paste_held(&mut None, text)
+}
+
+/// `paste_text` through `clipboard`, opening it first if it's `None`. The handle
+/// is left in place for the caller's next paste.
+fn paste_held(clipboard: &mut Option<arboard::Clipboard>, text: &str) -> Result<()> {
     if text.is_empty() {
         return Ok(());
     }
@@ -27,7 +137,10 @@ pub fn paste_text(text: &str) -> Result<()> {
     // any edit the user made to the previously-pasted field.
     crate::dictionary::capture_pending_correction();
 
-    let mut clipboard = arboard::Clipboard::new()?;
+    let clipboard = match clipboard.take() {
+        Some(c) => clipboard.insert(c),
+        None => clipboard.insert(arboard::Clipboard::new()?),
+    };
 
     // Save current clipboard content
     let saved = clipboard.get_text().ok();
@@ -35,8 +148,9 @@ pub fn paste_text(text: &str) -> Result<()> {
     // Set our text
     clipboard.set_text(text)?;
 
-    // Small delay for clipboard to be ready
-    std::thread::sleep(CLIPBOARD_SETTLE);
+    // Wait for the clipboard to be ready
+    #[cfg(not(target_os = "macos"))]
+    await_clipboard(clipboard, text);
 
     // Simulate paste keystroke. Capture the result instead of `?`-ing it so we
     // ALWAYS restore the user's clipboard below — otherwise a failed keystroke
@@ -46,8 +160,8 @@ pub fn paste_text(text: &str) -> Result<()> {
     // Wait for the paste to be consumed
     std::thread::sleep(PASTE_CONSUME);
 
-    // Restore previous clipboard
-    if let Some(old) = saved {
+    // Restore previous clipboard (nothing to do if it already held `text`)
+    if let Some(old) = saved.filter(|old| old != text) {
         // Brief delay before restoring
         std::thread::sleep(RESTORE_SETTLE);
         if let Err(e) = clipboard.set_text(&old) {
@@ -63,6 +177,19 @@ pub fn paste_text(text: &str) -> Result<()> {
     Ok(())
 }
 
+/// Block until the clipboard reads back `text` — the new content is being
+/// served — or `CLIPBOARD_SETTLE` runs out, whichever comes first.
+#[cfg(not(target_os = "macos"))]
+fn await_clipboard(clipboard: &mut arboard::Clipboard, text: &str) {
+    let deadline = std::time::Instant::now() + CLIPBOARD_SETTLE;
+    while clipboard.get_text().ok().as_deref() != Some(text) {
+        if std::time::Instant::now() >= deadline {
+            return;
+        }
+        std::thread::sleep(CLIPBOARD_POLL);
+    }
+}
+
 /// Type text progressively at the cursor — for streaming transcription.
 /// Uses clipboard + Cmd/Ctrl+V for each word (more reliable than character-by-character).
 /// Reserved: streaming dictation is disabled (see CLAUDE.md); batch paste is the live path.
@@ -92,18 +219,18 @@ fn simulate_paste() -> Result<()> {
         let source = CGEventSource::new(CGEventSourceStateID::HIDSystemState)
             .map_err(|_| anyhow::anyhow!("Failed to create CGEventSource"))?;
 
-        // Key code 9 = 'v'
+        // Key code 9 = 'v'. Both events are built before either is posted, so
+        // a creation failure can't leave a dangling key-down, and they go out
+        // back-to-back: the HID queue keeps them ordered, so the old 30 ms gap
+        // between them was pure latency.
         let key_down = CGEvent::new_keyboard_event(source.clone(), 9, true)
             .map_err(|_| anyhow::anyhow!("Failed to create key down event"))?;
-        key_down.set_flags(CGEventFlags::CGEventFlagCommand);
-        key_down.post(CGEventTapLocation::HID);
-
-        std::thread::sleep(std::time::Duration::from_millis(30));
-
         let key_up = CGEvent::new_keyboard_event(source, 9, false)
             .map_err(|_| anyhow::anyhow!("Failed to create key up event"))?;
-        key_up.set_flags(CGEventFlags::CGEventFlagCommand);
-        key_up.post(CGEventTapLocation::HID);
+        for event in [&key_down, &key_up] {
+            event.set_flags(CGEventFlags::CGEventFlagCommand);
+            event.post(CGEventTapLocation::HID);
+        }
 
         Ok(())
     }
@@ -111,17 +238,39 @@ fn simulate_paste() -> Result<()> {
     #[cfg(not(target_os = "macos"))]
     {
         use enigo::{Enigo, Key, Keyboard, Settings};
-        let mut enigo = Enigo::new(&Settings::default())
-            .map_err(|e| anyhow::anyhow!("Failed to create input simulator: {e}"))?;
-        enigo
-            .key(Key::Control, enigo::Direction::Press)
-            .map_err(|e| anyhow::anyhow!("Key press failed: {e}"))?;
-        enigo
-            .key(Key::Unicode('v'), enigo::Direction::Click)
-            .map_err(|e| anyhow::anyhow!("Key click failed: {e}"))?;
-        enigo
-            .key(Key::Control, enigo::Direction::Release)
-            .map_err(|e| anyhow::anyhow!("Key release failed: {e}"))?;
-        Ok(())
+        use std::cell::RefCell;
+
+        // The input simulator (an X11/libei connection, or the Windows input
+        // state) is opened once per thread and reused — pastes all run on the
+        // paste worker — instead of reconnecting for every Ctrl+V. Dropped
+        // after a failure so the next paste reconnects.
+        thread_local! {
+            static ENIGO: RefCell<Option<Enigo>> = const { RefCell::new(None) };
+        }
+        ENIGO.with_borrow_mut(|slot| -> Result<()> {
+            let enigo = match slot.take() {
+                Some(e) => slot.insert(e),
+                None => slot.insert(
+                    Enigo::new(&Settings::default())
+                        .map_err(|e| anyhow::anyhow!("Failed to create input simulator: {e}"))?,
+                ),
+            };
+            let result = (|| -> Result<()> {
+                enigo
+                    .key(Key::Control, enigo::Direction::Press)
+                    .map_err(|e| anyhow::anyhow!("Key press failed: {e}"))?;
+                enigo
+                    .key(Key::Unicode('v'), enigo::Direction::Click)
+                    .map_err(|e| anyhow::anyhow!("Key click failed: {e}"))?;
+                enigo
+                    .key(Key::Control, enigo::Direction::Release)
+                    .map_err(|e| anyhow::anyhow!("Key release failed: {e}"))?;
+                Ok(())
+            })();
+            if result.is_err() {
+                *slot = None;
+            }
+            result
+        })
     }
 }
@@ -263,7 +263,9 @@ fn request_microphone() {
 #[cfg(target_os = "macos")]
 pub fn open_settings(pane: &str) {
     let url = format!("x-apple.systempreferences:com.apple.preference.security?{pane}");
-    let _ = std::process::Command::new("open").arg(&url).spawn();
+    let _ = std::process::Command::new("/usr/bin/open")
+        .arg(&url)
+        .spawn();
 }
 
 // ── Microphone ──────────────────────────────────────────────────
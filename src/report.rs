@@ -150,7 +150,9 @@ pub fn open_report() {
 
     #[cfg(target_os = "macos")]
     {
-        let _ = std::process::Command::new("open").arg(&url).spawn();
+        let _ = std::process::Command::new("/usr/bin/open")
+            .arg(&url)
+            .spawn();
     }
     #[cfg(target_os = "linux")]
     {
@@ -201,7 +203,7 @@ pub fn install_panic_hook() {
             let safe_msg = crate::notify::applescript_escape(&format!("Crashed: {payload}"));
             let script =
                 format!(r#"display notification "{safe_msg}" with title "Whisper Push Crashed""#);
-            let _ = std::process::Command::new("osascript")
+            let _ = std::process::Command::new("/usr/bin/osascript")
                 .arg("-e")
                 .arg(&script)
                 .spawn();
@@ -35,6 +35,11 @@ pub enum Event {
     HotkeyUp,
     /// Hotkey toggled (toggle mode)
     HotkeyToggle,
+    /// Toggle-mode end-pointing: the recording this end-pointer belongs to has
+    /// gone silent for `auto_stop_silence_ms` after speech. Ignored if that
+    /// recording has already ended (the `Weak` no longer upgrades), so a late
+    /// one can never cut a newer recording short.
+    AutoStop(std::sync::Weak<crate::audio::capture::Endpointer>),
     /// A custom hotkey was captured (hotkey string, mode)
     HotkeyCaptured(String, String),
     /// Model loaded and ready
@@ -63,6 +68,9 @@ pub enum Event {
     /// Trailing tray-icon refresh: re-apply the current state's icon on the main
     /// thread after a coalesced burst (see `tray::set_tray_icon`).
     RefreshTrayIcon,
+    /// State watchdog deadline (a main-loop timer armed on entering
+    /// Processing / Recording): recover if that state has outlived its limit.
+    CheckStuckState,
     /// Load model on the pipeline thread (needed for WGPU same-thread requirement)
     LoadModel(String),
     /// A new version is available (version, download_url)
@@ -170,22 +178,19 @@ pub fn acquire_lock() -> Result<std::fs::File> {
 }
 
 pub fn current_status() -> String {
-    // Simple check: is the lock file held?
+    // Simple check: is the lock file held? One `open` answers both "does it
+    // exist" (NotFound) and "can we probe it" — no separate `exists()` stat.
     let lock_path = crate::config::data_dir().join("whisper-push.lock");
-    if lock_path.exists() {
-        let file = std::fs::OpenOptions::new().write(true).open(&lock_path);
-        match file {
-            Ok(f) => {
-                use fs4::fs_std::FileExt;
-                match f.try_lock_exclusive() {
-                    Ok(_) => "Idle (no instance running)".into(),
-                    Err(_) => "Running".into(),
-                }
+    match std::fs::OpenOptions::new().write(true).open(&lock_path) {
+        Ok(f) => {
+            use fs4::fs_std::FileExt;
+            match f.try_lock_exclusive() {
+                Ok(_) => "Idle (no instance running)".into(),
+                Err(_) => "Running".into(),
             }
-            Err(_) => "Unknown".into(),
         }
-    } else {
-        "Idle (no instance running)".into()
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => "Idle (no instance running)".into(),
+        Err(_) => "Unknown".into(),
     }
 }
 
@@ -68,6 +68,7 @@ fn load_from_disk() {
     *TEMPLATES.lock_safe() = parsed;
     LOADED.store(true, Ordering::Relaxed);
     DIRTY.store(true, Ordering::Relaxed);
+    crate::tray::wake_main();
 }
 
 /// Re-read `templates.toml` from disk (after the user edits it).
@@ -150,6 +151,7 @@ fn save() -> anyhow::Result<()> {
     )?;
     std::fs::rename(&tmp, &path)?;
     DIRTY.store(true, Ordering::Relaxed);
+    crate::tray::wake_main();
     Ok(())
 }
 
@@ -174,7 +176,8 @@ pub fn count() -> usize {
     TEMPLATES.lock_safe().len()
 }
 
-/// True at most once per change — the tray polls this to refresh its submenu.
+/// True at most once per change — the tray checks this (woken by the change)
+/// to refresh its submenu.
 pub fn take_dirty() -> bool {
     DIRTY.swap(false, Ordering::Relaxed)
 }
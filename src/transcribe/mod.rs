@@ -32,7 +32,26 @@ impl Backend {
     }
 }
 
-static MODEL: Mutex<Option<whisper_rs::WhisperContext>> = Mutex::new(None);
+/// The loaded Whisper model, held as its decoding state (which keeps the
+/// context alive). Creating a state allocates the KV cache and compute buffers —
+/// GPU memory on Metal — so it's made once per load and reused by every
+/// transcription and keep-warm tick instead of once per call.
+static MODEL: Mutex<Option<whisper_rs::WhisperState>> = Mutex::new(None);
+
+/// The model the pipeline last loaded successfully. Re-selecting the engine
+/// that's already loaded then costs nothing, instead of an unload and a full
+/// reload of the same weights behind a "Loading" icon.
+static LOADED_NAME: Mutex<Option<String>> = Mutex::new(None);
+
+/// True if `name` is the model currently loaded.
+pub fn is_model_loaded(name: &str) -> bool {
+    LOADED_NAME.lock_safe().as_deref() == Some(name)
+}
+
+/// Record which model is loaded (`None` while switching or after a failure).
+pub fn set_loaded_model(name: Option<&str>) {
+    *LOADED_NAME.lock_safe() = name.map(str::to_string);
+}
 
 // ─── Keep-warm ───────────────────────────────────────────────────────────────
 // A large model (Parakeet ships 2.3 GB of FP32 weights) is mmapped by the
@@ -62,6 +81,8 @@ const KEEP_WARM_INTERVAL: Duration = Duration::from_secs(90);
 /// Silence length for a warm tick: 1 s @ 16 kHz, enough to run the full encoder
 /// forward pass (touching every weight) on any backend.
 pub(crate) const WARM_SAMPLES: usize = 16_000;
+/// Decoder budget for a warm-up inference (Whisper).
+const WARM_MAX_TOKENS: i32 = 8;
 
 /// Upper bound on a model download. Generous — a ~1.5 GB Whisper / 2.3 GB
 /// Parakeet pull over a slow link must not be aborted — but finite, so a
@@ -91,18 +112,15 @@ pub(crate) fn page_faults() -> (i64, i64) {
 /// macOS Apple-Silicon page size (also the unit `vm_stat`/`footprint` report).
 const PAGE_BYTES: i64 = 16_384;
 
-/// Whisper keep-warm: a tiny inference on silence to keep the weights resident.
+/// Whisper keep-warm: a tiny inference on `audio` to keep the weights resident.
 /// Non-blocking — if a real transcription holds the model lock, skip this tick.
-fn warm_whisper() {
-    let Some(guard) = MODEL.try_lock_safe() else {
+fn warm_whisper(audio: &[f32]) {
+    let Some(mut guard) = MODEL.try_lock_safe() else {
         return;
     };
-    let Some(ctx) = guard.as_ref() else {
+    let Some(state) = guard.as_mut() else {
         return; // Whisper isn't the loaded backend
     };
-    let Ok(mut state) = ctx.create_state() else {
-        return;
-    };
     let mut params =
         whisper_rs::FullParams::new(whisper_rs::SamplingStrategy::Greedy { best_of: 1 });
     params.set_print_special(false);
@@ -110,11 +128,57 @@ fn warm_whisper() {
     params.set_print_realtime(false);
     params.set_print_timestamps(false);
     params.set_single_segment(true);
+    params.set_no_timestamps(true);
+    params.set_n_threads(whisper_threads());
+    // A few tokens are enough to set up the decoder; don't let a voiced warm-up
+    // hallucinate a full segment.
+    params.set_max_tokens(WARM_MAX_TOKENS);
     let t = std::time::Instant::now();
-    let _ = state.full(params, &vec![0.0f32; WARM_SAMPLES]);
+    let _ = state.full(params, audio);
     tracing::debug!("whisper kept warm ({:.2}s)", t.elapsed().as_secs_f64());
 }
 
+/// Speech-like warm-up input: 1 s of a 120 Hz voiced buzz (harmonics falling
+/// off as 1/k) cut into four 4 Hz "syllables". On silence whisper's decoder
+/// emits end-of-text at once, so only the encoder gets exercised; a voiced
+/// buffer also drives both backends through their decoder loop, so the first
+/// real dictation doesn't pay its one-time kernel/thread-pool setup.
+pub(crate) fn voiced_warmup() -> Vec<f32> {
+    use std::f32::consts::PI;
+    const F0: f32 = 120.0;
+    const SYLLABLE_HZ: f32 = 4.0;
+    const HARMONICS: usize = 20;
+    (0..WARM_SAMPLES)
+        .map(|i| {
+            let t = i as f32 / crate::audio::SAMPLE_RATE as f32;
+            let buzz: f32 = (1..=HARMONICS)
+                .map(|k| (2.0 * PI * F0 * k as f32 * t).sin() / k as f32)
+                .sum();
+            let envelope = (PI * SYLLABLE_HZ * t).sin().powi(2);
+            0.15 * buzz * envelope
+        })
+        .collect()
+}
+
+fn warm_with(audio: &[f32]) {
+    parakeet::warm(audio);
+    warm_whisper(audio);
+}
+
+/// One silent inference on whichever of Parakeet / Whisper is loaded (the other
+/// is a no-op) — the keep-warm tick, which only needs to touch every weight.
+pub fn warm_loaded() {
+    warm_with(&vec![0.0f32; WARM_SAMPLES]);
+}
+
+/// Post-load warm-up: one inference on `voiced_warmup()` instead of silence.
+/// The pipeline runs this right after a model load, so the first dictation
+/// pays neither the page-in of the freshly mmapped weights nor the decoder's
+/// first-run setup.
+pub fn prime_loaded() {
+    warm_with(&voiced_warmup());
+}
+
 /// Spawn the keep-warm heartbeat. Every interval, while a model is loaded, it
 /// runs a tiny silent inference that touches every weight, so macOS never
 /// reclaims the pages and the first dictation after any idle gap — including the
@@ -146,10 +210,7 @@ pub fn spawn_keep_warm(enabled: bool) {
                 // the heartbeat for the rest of the session — silently bringing
                 // the cold-start back while real dictations still work. The locks
                 // are poison-tolerant (`try_lock_safe`), so the next tick recovers.
-                let _ = std::panic::catch_unwind(|| {
-                    parakeet::warm();
-                    warm_whisper();
-                });
+                let _ = std::panic::catch_unwind(warm_loaded);
             }
         })
         .ok();
@@ -179,8 +240,12 @@ pub fn load_model(model_name: &str) -> Result<()> {
         .ok_or_else(|| anyhow::anyhow!("Model path is not valid UTF-8: {}", path.display()))?;
     let ctx = whisper_rs::WhisperContext::new_with_params(path_str, ctx_params)
         .map_err(|e| anyhow::anyhow!("Failed to load model: {:?}", e))?;
+    let state = ctx
+        .create_state()
+        .map_err(|e| anyhow::anyhow!("Failed to create state: {:?}", e))?;
 
-    *MODEL.lock_safe() = Some(ctx);
+    *MODEL.lock_safe() = Some(state);
+    tracing::debug!("whisper.cpp: {}", whisper_rs::print_system_info().trim());
     info!("Model loaded and ready");
     Ok(())
 }
@@ -305,10 +370,16 @@ fn transcribe_inner(audio: &[f32], language: &str, backend: &Backend) -> Result<
     Ok(whisper_push_dict::finalize_and_record(&acoustic, language))
 }
 
+/// CPU threads for whisper.cpp: every available core, capped at 8 — past that
+/// the quantized kernels are memory-bound and extra threads only add contention.
+fn whisper_threads() -> i32 {
+    std::thread::available_parallelism().map_or(4, |n| n.get().min(8) as i32)
+}
+
 fn transcribe_whisper(audio: &[f32], language: &str) -> Result<String> {
-    let guard = MODEL.lock_safe();
-    let ctx = guard
-        .as_ref()
+    let mut guard = MODEL.lock_safe();
+    let state = guard
+        .as_mut()
         .ok_or_else(|| anyhow::anyhow!("Model not loaded"))?;
 
     let mut params =
@@ -326,11 +397,20 @@ fn transcribe_whisper(audio: &[f32], language: &str) -> Result<String> {
     params.set_print_timestamps(false);
     params.set_suppress_blank(true);
     params.set_single_segment(true);
-
-    // Create state and run inference
-    let mut state = ctx
-        .create_state()
-        .map_err(|e| anyhow::anyhow!("Failed to create state: {:?}", e))?;
+    // Dictation only needs the text: skipping timestamp tokens saves decoder
+    // steps, and whisper.cpp's default of 4 threads leaves the encoder's matmuls
+    // on half the cores of an M-series / desktop CPU.
+    params.set_no_timestamps(true);
+    params.set_n_threads(whisper_threads());
+    // The state is reused across calls: never carry the previous dictation's
+    // text over as a decoding prompt.
+    params.set_no_context(true);
+    // One greedy pass at temperature 0, no fallback ladder: whisper.cpp would
+    // otherwise re-decode the whole segment at +0.2 steps whenever its entropy /
+    // log-prob checks fail, multiplying decoder time on exactly the hesitant,
+    // noisy clips where latency is already worst.
+    params.set_temperature(0.0);
+    params.set_temperature_inc(0.0);
 
     state
         .full(params, audio)
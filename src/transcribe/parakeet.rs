@@ -67,18 +67,17 @@ mod inner {
         PARAKEET.lock_safe().is_some()
     }
 
-    /// Keep the model's pages resident by running a tiny inference on silence.
+    /// Keep the model's pages resident by running a tiny inference on `audio`.
     /// Non-blocking — if a real transcription holds the lock, skip this tick.
-    pub fn warm() {
+    pub fn warm(audio: &[f32]) {
         let Some(mut guard) = PARAKEET.try_lock_safe() else {
             return;
         };
         let Some(parakeet) = guard.as_mut() else {
             return; // Parakeet isn't the loaded backend
         };
-        let silence = vec![0.0f32; crate::transcribe::WARM_SAMPLES];
         let t = std::time::Instant::now();
-        match parakeet.transcribe_samples(silence, 16000, 1, None) {
+        match parakeet.transcribe_samples(audio.to_vec(), 16000, 1, None) {
             Ok(_) => tracing::debug!("parakeet kept warm ({:.2}s)", t.elapsed().as_secs_f64()),
             Err(e) => tracing::debug!("parakeet warm failed: {e}"),
         }
@@ -237,7 +236,7 @@ pub fn load_model(_model_name: &str) -> anyhow::Result<()> {
 #[cfg(not(feature = "parakeet"))]
 pub fn unload_model() {}
 #[cfg(not(feature = "parakeet"))]
-pub fn warm() {}
+pub fn warm(_audio: &[f32]) {}
 #[cfg(not(feature = "parakeet"))]
 pub fn is_loaded() -> bool {
     false
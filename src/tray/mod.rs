@@ -3,6 +3,7 @@ use crate::state::{AppState, Event, State};
 use crate::util::LockSafe;
 use anyhow::Result;
 use crossbeam_channel::{Receiver, Sender};
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::{Arc, Mutex, OnceLock};
 use std::time::{Duration, Instant};
 use tracing::{debug, info, warn};
@@ -24,6 +25,7 @@ const TINT_RECORDING: [u8; 3] = [0xCE, 0xDC, 0x00];
 const BUSY_OPACITY: u8 = 110;
 
 /// How to render the master glyph for a given state.
+#[derive(Clone, Copy, PartialEq)]
 enum GlyphStyle {
     /// Monochrome macOS template (auto black/white) at the given opacity:
     /// 255 = crisp (idle), lower = dimmed (busy). Visible on any background.
@@ -32,11 +34,36 @@ enum GlyphStyle {
     Tint([u8; 3]),
 }
 
+/// The tray icon for `style`. There are only three styles, so each is rendered
+/// once and reused — a state change hands the status item a ready icon instead
+/// of recolouring and re-uploading pixels. Main thread only (like the tray).
+fn glyph_icon(style: GlyphStyle) -> Option<Icon> {
+    thread_local! {
+        static STYLED: std::cell::RefCell<Vec<(GlyphStyle, Icon)>> =
+            const { std::cell::RefCell::new(Vec::new()) };
+    }
+    let cached = STYLED.with_borrow(|c| {
+        c.iter()
+            .find(|(s, _)| *s == style)
+            .map(|(_, icon)| icon.clone())
+    });
+    if cached.is_some() {
+        return cached;
+    }
+    let icon = render_glyph(style)?;
+    STYLED.with_borrow_mut(|c| c.push((style, icon.clone())));
+    Some(icon)
+}
+
 /// Build a tray icon from the one master glyph, applying `style`. The geometry
 /// is always identical — only colour/opacity change — so the icon never shifts
-/// size or shape between states.
-fn glyph_icon(style: GlyphStyle) -> Option<Icon> {
-    let mut img = image::load_from_memory(ICON_GLYPH).ok()?.into_rgba8();
+/// size or shape between states. The PNG is decoded once; each style recolours
+/// a copy of the cached pixels.
+fn render_glyph(style: GlyphStyle) -> Option<Icon> {
+    static GLYPH_RGBA: OnceLock<Option<image::RgbaImage>> = OnceLock::new();
+    let mut img = GLYPH_RGBA
+        .get_or_init(|| Some(image::load_from_memory(ICON_GLYPH).ok()?.into_rgba8()))
+        .clone()?;
     match style {
         GlyphStyle::Tint([r, g, b]) => {
             for px in img.pixels_mut() {
@@ -224,13 +251,7 @@ impl App {
         let status_item = MenuItem::new(&status_text, false, None);
 
         // Hotkey submenu (titled with the current binding)
-        let hotkey_submenu = Submenu::new(
-            &format!(
-                "Hotkey: {}",
-                format_hotkey_display(&cfg.hotkey, &cfg.hotkey_mode)
-            ),
-            true,
-        );
+        let hotkey_submenu = Submenu::new(&format!("Hotkey: {disp}"), true);
         let mut hotkey_items = Vec::new();
         for (label, hotkey, mode) in HOTKEY_PRESETS {
             let checked = *hotkey == cfg.hotkey && *mode == cfg.hotkey_mode;
@@ -390,7 +411,8 @@ impl App {
         let _ = dict_submenu.append(&MenuItem::new("Your words (click to remove):", false, None));
         // One removable item per word — kept at the end so we can refresh just
         // these without disturbing the stable action items above.
-        let dict_entry_items = populate_dict_entries(&dict_submenu);
+        let mut dict_entry_items = Vec::new();
+        populate_dict_entries(&dict_submenu, &mut dict_entry_items);
         let dict_correct_last_id = dict_correct_last_item.id().0.clone();
         let dict_add_id = dict_add_item.id().0.clone();
         let dict_open_id = dict_open_item.id().0.clone();
@@ -427,7 +449,8 @@ impl App {
             false,
             None,
         ));
-        let template_items = populate_template_items(&templates_submenu);
+        let mut template_items = Vec::new();
+        populate_template_items(&templates_submenu, &mut template_items);
         let template_add_id = template_add_item.id().0.clone();
         let template_open_id = template_open_item.id().0.clone();
         let template_reload_id = template_reload_item.id().0.clone();
@@ -440,7 +463,8 @@ impl App {
         let _ = history_submenu.append(&history_clear_item);
         let _ = history_submenu.append(&PredefinedMenuItem::separator());
         let _ = history_submenu.append(&MenuItem::new("Recent (click to copy):", false, None));
-        let history_entry_items = populate_history_entries(&history_submenu);
+        let mut history_entry_items = Vec::new();
+        populate_history_entries(&history_submenu, &mut history_entry_items);
         let history_open_id = history_open_item.id().0.clone();
         let history_clear_id = history_clear_item.id().0.clone();
 
@@ -627,11 +651,7 @@ impl App {
 
         // Prompt permissions after a short delay
         if !perms.all_granted() {
-            let tx = self.state.tx.clone();
-            std::thread::spawn(move || {
-                std::thread::sleep(std::time::Duration::from_millis(500));
-                let _ = tx.send(Event::PromptPermissions);
-            });
+            schedule_main(Duration::from_millis(500), Event::PromptPermissions);
         }
 
         info!("Tray icon created");
@@ -639,16 +659,13 @@ impl App {
 
     /// Rebuild just the listed word items (after add/remove/correct/reload).
     /// Action items above keep their stable IDs; only the trailing entries are
-    /// removed and re-appended. Runs on the main thread (menu is closed).
+    /// relabelled / added / removed (see `sync_rows`). Runs on the main thread
+    /// (menu is closed).
     fn refresh_dict_submenu(&mut self) {
         let Some(mi) = self.menu_items.as_mut() else {
             return;
         };
-        let old = std::mem::take(&mut mi.dict_entry_items);
-        for (it, _) in old {
-            let _ = mi.dict_submenu.remove(&it);
-        }
-        mi.dict_entry_items = populate_dict_entries(&mi.dict_submenu);
+        populate_dict_entries(&mi.dict_submenu, &mut mi.dict_entry_items);
         let n = crate::dictionary::entry_count();
         mi.dict_submenu.set_text(format!("Dictionary ({n})"));
     }
@@ -658,11 +675,7 @@ impl App {
         let Some(mi) = self.menu_items.as_mut() else {
             return;
         };
-        let old = std::mem::take(&mut mi.history_entry_items);
-        for (it, _) in old {
-            let _ = mi.history_submenu.remove(&it);
-        }
-        mi.history_entry_items = populate_history_entries(&mi.history_submenu);
+        populate_history_entries(&mi.history_submenu, &mut mi.history_entry_items);
     }
 
     /// Rebuild the trigger list + count in the Templates submenu.
@@ -670,11 +683,7 @@ impl App {
         let Some(mi) = self.menu_items.as_mut() else {
             return;
         };
-        let old = std::mem::take(&mut mi.template_items);
-        for (it, _) in old {
-            let _ = mi.templates_submenu.remove(&it);
-        }
-        mi.template_items = populate_template_items(&mi.templates_submenu);
+        populate_template_items(&mi.templates_submenu, &mut mi.template_items);
         mi.templates_submenu
             .set_text(format!("Templates ({})", crate::templates::count()));
     }
@@ -1048,6 +1057,12 @@ impl App {
                                 bi.set_text(format!("{active}{}{dl}", m.label));
                             }
                         }
+                        // Re-picking the model that's already loaded: nothing to
+                        // load, so no LoadModel and no "Loading…" toast that the
+                        // pipeline would never resolve.
+                        if crate::transcribe::is_model_loaded(model_name) {
+                            return;
+                        }
                         // Send LoadModel to the pipeline thread — it unloads the old
                         // model and loads (downloading if needed) the new one on its
                         // own thread (WGPU/Metal same-thread constraint).
@@ -1070,9 +1085,13 @@ impl App {
                 // (the pipeline thread now emits this so the icon turns citron
                 // regardless of how recording started). The start sound is
                 // played at each trigger point, never here, to avoid doubling.
+                let entered = self.state.current() != State::Recording;
                 self.state.set(State::Recording);
                 set_tray_icon(&self.tray, State::Recording);
                 crate::overlay::set_state(crate::overlay::OverlayState::Recording);
+                if entered {
+                    arm_state_watchdog(State::Recording);
+                }
             }
 
             // Pill-only events (the tray icon stays on StateChanged). ShowOverlay
@@ -1113,11 +1132,7 @@ impl App {
                     crate::permissions::guided_setup();
                 }
                 // Schedule a re-check to update the menu
-                let tx = self.state.tx.clone();
-                std::thread::spawn(move || {
-                    std::thread::sleep(std::time::Duration::from_secs(3));
-                    let _ = tx.send(Event::RefreshPermissions);
-                });
+                schedule_main(Duration::from_secs(3), Event::RefreshPermissions);
             }
 
             Event::RefreshPermissions => {
@@ -1171,11 +1186,7 @@ impl App {
                 );
                 // Re-check again in 5s if still not all granted
                 if !status.all_granted() {
-                    let tx = self.state.tx.clone();
-                    std::thread::spawn(move || {
-                        std::thread::sleep(std::time::Duration::from_secs(5));
-                        let _ = tx.send(Event::RefreshPermissions);
-                    });
+                    schedule_main(Duration::from_secs(5), Event::RefreshPermissions);
                 }
             }
 
@@ -1206,12 +1217,22 @@ impl App {
             }
 
             Event::StateChanged(s) => {
+                // `set` echoes a StateChanged back when the state moves; arm the
+                // watchdog on the real transition only, not on the echo.
+                let entered = self.state.current() != s;
                 self.state.set(s);
                 set_tray_icon(&self.tray, s); // also refreshes the tooltip
                 crate::overlay::set_state(match s {
                     State::Processing => crate::overlay::OverlayState::Processing,
                     _ => crate::overlay::OverlayState::Idle, // Idle / Loading
                 });
+                if entered {
+                    arm_state_watchdog(s);
+                }
+            }
+
+            Event::CheckStuckState => {
+                check_stuck_state(&self.state.tx, self.pipeline_tx.as_ref());
             }
 
             _ => {}
@@ -1230,14 +1251,7 @@ impl ApplicationHandler<UserEvent> for App {
     ) {
     }
 
-    fn new_events(&mut self, event_loop: &ActiveEventLoop, cause: winit::event::StartCause) {
-        // WaitUntil(500ms) — needed for NSEvent monitors to fire (they require
-        // the run loop to pump events). 500ms is slow enough to not close menus
-        // on most interactions, but fast enough for hotkey responsiveness.
-        event_loop.set_control_flow(winit::event_loop::ControlFlow::WaitUntil(
-            std::time::Instant::now() + std::time::Duration::from_millis(500),
-        ));
-
+    fn new_events(&mut self, _event_loop: &ActiveEventLoop, cause: winit::event::StartCause) {
         if cause == winit::event::StartCause::Init {
             // Load model SYNCHRONOUSLY before creating the tray,
             // so the menu starts in "Ready" state and never needs updating.
@@ -1259,8 +1273,6 @@ impl ApplicationHandler<UserEvent> for App {
             let pipeline_cfg = self.config.clone();
             let (ptx, prx) = crossbeam_channel::unbounded();
             self.pipeline_tx = Some(ptx.clone());
-            // Publish for the state watchdog (stuck-Recording recovery).
-            let _ = PIPELINE_TX.set(ptx.clone());
             // The pipeline keeps a sender to its own channel so it can re-queue an
             // event it must not drop (e.g. a model switch that lands during the
             // hold-delay gate).
@@ -1298,16 +1310,20 @@ impl ApplicationHandler<UserEvent> for App {
         // No polling needed — ControlFlow::Wait keeps the run loop clean.
     }
 
-    fn about_to_wait(&mut self, _event_loop: &ActiveEventLoop) {
-        // Poll all event sources. No EventLoopProxy used — avoids macOS Tahoe
-        // menu closing bug. This is called every ~100ms via WaitUntil.
+    fn about_to_wait(&mut self, event_loop: &ActiveEventLoop) {
+        // Drain all event sources. No EventLoopProxy used — avoids macOS Tahoe
+        // menu closing bug. Runs whenever the run loop wakes: on each forwarded
+        // app event, after AppKit input (menu clicks), or at the fallback tick.
 
         // 1. Menu events (clicked items)
         while let Ok(event) = MenuEvent::receiver().try_recv() {
             self.process_event(Event::MenuClicked(event.id().0.to_string()));
         }
 
-        // 2. App events (hotkey, transcription, model loading, etc.)
+        // 2. App events (hotkey, transcription, model loading, etc.). Re-arm the
+        // forwarder's wake *before* draining, so an event landing after the
+        // drain always triggers a fresh wake.
+        UI_WAKE_PENDING.store(false, Ordering::SeqCst);
         while let Ok(event) = self.rx.try_recv() {
             self.process_event(event);
         }
@@ -1323,6 +1339,27 @@ impl ApplicationHandler<UserEvent> for App {
         if crate::templates::take_dirty() {
             self.refresh_templates_submenu();
         }
+
+        // 5. Delayed main-thread work (tray debounce, permission re-checks,
+        // state watchdog).
+        // Handling one may schedule another, so drain until nothing is due.
+        while let Some(event) = take_due_timer(Instant::now()) {
+            self.process_event(event);
+        }
+
+        // Sleep until the next timer (or the fallback tick, where there is
+        // one). Otherwise block until something wakes the run loop: every app
+        // event is forwarded with a wake (see `spawn_ui_forwarder`), and the
+        // dirty-flag modules call `wake_main` when they flag a refresh.
+        let tick = MAIN_LOOP_TICK.map(|t| Instant::now() + t);
+        let deadline = match (next_timer_deadline(), tick) {
+            (Some(a), Some(b)) => Some(a.min(b)),
+            (a, b) => a.or(b),
+        };
+        event_loop.set_control_flow(match deadline {
+            Some(d) => winit::event_loop::ControlFlow::WaitUntil(d),
+            None => winit::event_loop::ControlFlow::Wait,
+        });
     }
 
     fn user_event(&mut self, _event_loop: &ActiveEventLoop, event: UserEvent) {
@@ -1350,14 +1387,8 @@ pub fn run(state: AppState, rx: Receiver<Event>) -> Result<()> {
     // EventLoopProxy wake-ups cause macOS Tahoe to close the tray menu (Apple bug).
     // Instead, we use WaitUntil(100ms) so about_to_wait is called periodically.
 
-    // Sender for the coalesced trailing tray-icon refresh (see set_tray_icon).
-    let _ = TRAY_TX.set(state.tx.clone());
-
-    // Safety net against a wedged state machine (a lost Processing→Idle
-    // transition leaves the app silently refusing dictations — observed in the
-    // wild). Force Idle if Processing persists far longer than any real
-    // transcription could take.
-    spawn_state_watchdog(state.tx.clone());
+    // Wake the run loop per app event instead of discovering it on the next tick.
+    let rx = spawn_ui_forwarder(rx);
 
     // Floating "listening" pill — created hidden on the main thread now; shown
     // with a live citron waveform while recording.
@@ -1371,8 +1402,74 @@ pub fn run(state: AppState, rx: Receiver<Event>) -> Result<()> {
     Ok(())
 }
 
-/// Poll interval for the state watchdog.
-const WATCHDOG_TICK: Duration = Duration::from_secs(10);
+/// Fallback wake-up of the winit main loop. None on macOS: every app event wakes
+/// the run loop as it is forwarded (`spawn_ui_forwarder` → `wake_main`), the
+/// dictionary/history/templates dirty bits call `wake_main` when set, and menu
+/// clicks arrive through AppKit's own input — so an idle daemon sleeps until
+/// there is work. Elsewhere `wake_main` is a no-op, so the tick still bounds UI
+/// latency.
+#[cfg(target_os = "macos")]
+const MAIN_LOOP_TICK: Option<Duration> = None;
+#[cfg(not(target_os = "macos"))]
+const MAIN_LOOP_TICK: Option<Duration> = Some(Duration::from_millis(500));
+
+thread_local! {
+    /// Main-thread timers: `(due, event)` pairs fired from `about_to_wait`. The
+    /// run loop's own `WaitUntil` deadline does the waiting, so a delayed UI
+    /// action costs a Vec entry instead of a sleeping thread per call.
+    static MAIN_TIMERS: std::cell::RefCell<Vec<(Instant, Event)>> =
+        const { std::cell::RefCell::new(Vec::new()) };
+}
+
+/// Deliver `event` to `App::process_event` on the main thread after `after`.
+/// Must be called from the main thread (anything in `process_event` is).
+fn schedule_main(after: Duration, event: Event) {
+    MAIN_TIMERS.with(|t| t.borrow_mut().push((Instant::now() + after, event)));
+}
+
+/// Pop the earliest timer that is due at `now`, if any.
+fn take_due_timer(now: Instant) -> Option<Event> {
+    MAIN_TIMERS.with(|t| {
+        let mut t = t.borrow_mut();
+        let i = (0..t.len())
+            .filter(|&i| t[i].0 <= now)
+            .min_by_key(|&i| t[i].0)?;
+        Some(t.swap_remove(i).1)
+    })
+}
+
+fn next_timer_deadline() -> Option<Instant> {
+    MAIN_TIMERS.with(|t| t.borrow().iter().map(|(due, _)| *due).min())
+}
+
+/// Set by the UI forwarder when it has woken the main loop and the loop hasn't
+/// drained yet; a burst of events (Recording → Processing → Idle within a few
+/// hundred ms) then costs one wake, not one per event.
+static UI_WAKE_PENDING: AtomicBool = AtomicBool::new(false);
+
+/// Relay app events onto a fresh channel, waking the main run loop for them.
+/// Senders stay plain `crossbeam` senders (worker threads, watchdog, tray
+/// debounce…), so nothing at the call sites has to remember to wake the UI —
+/// the relay does it once, here, coalesced through `UI_WAKE_PENDING`. Returns
+/// the receiver `App` drains.
+fn spawn_ui_forwarder(rx: Receiver<Event>) -> Receiver<Event> {
+    let (fwd_tx, fwd_rx) = crossbeam_channel::unbounded();
+    std::thread::Builder::new()
+        .name("ui-forwarder".into())
+        .spawn(move || {
+            for ev in rx.iter() {
+                if fwd_tx.send(ev).is_err() {
+                    break;
+                }
+                if !UI_WAKE_PENDING.swap(true, Ordering::SeqCst) {
+                    wake_main();
+                }
+            }
+        })
+        .ok();
+    fwd_rx
+}
+
 /// Force Idle if `Processing` has lasted longer than this — a real transcription
 /// (even a cold-start page-in) finishes in well under 10 s, so this only ever
 /// fires on a genuine wedge, never on a legitimately slow dictation.
@@ -1382,40 +1479,59 @@ const WATCHDOG_MAX_PROCESSING: u64 = 30;
 /// CGEventTap died) and the mic is stuck open. We end it via the *normal* stop
 /// path so whatever was captured is still transcribed and pasted.
 const WATCHDOG_MAX_RECORDING: u64 = 300;
+/// How soon a check that had to intervene looks again (the old poll period).
+const WATCHDOG_RETRY: Duration = Duration::from_secs(10);
+
+/// Arm the state watchdog for a state just entered (main thread): a main-loop
+/// timer fires `CheckStuckState` once the state's limit has passed, instead of
+/// a thread polling around the clock. Nothing is cancelled on leaving the state
+/// — a stale check finds the `*_SINCE` stamp reset (or fresh) and does nothing.
+/// The extra second covers the whole-second resolution of those stamps.
+fn arm_state_watchdog(state: State) {
+    let limit = match state {
+        State::Processing => WATCHDOG_MAX_PROCESSING,
+        State::Recording => WATCHDOG_MAX_RECORDING,
+        State::Idle | State::Loading => return,
+    };
+    schedule_main(Duration::from_secs(limit + 1), Event::CheckStuckState);
+}
 
 /// Recover from a wedged state machine:
 /// - stuck in `Processing` (a lost Processing→Idle transition) → force `Idle`,
 ///   so the app can't silently refuse all further dictations;
 /// - stuck in `Recording` (a dropped `HotkeyUp` left the mic open) → inject a
 ///   `HotkeyUp` into the pipeline, which stops + transcribes + returns to Idle.
-fn spawn_state_watchdog(tx: Sender<Event>) {
-    std::thread::Builder::new()
-        .name("state-watchdog".into())
-        .spawn(move || {
-            loop {
-                std::thread::sleep(WATCHDOG_TICK);
-                if let Some(secs) = crate::state::processing_stuck_secs() {
-                    if secs >= WATCHDOG_MAX_PROCESSING {
-                        warn!("state watchdog: stuck in Processing for {secs}s — forcing Idle");
-                        let _ = tx.send(Event::StateChanged(State::Idle));
-                    }
-                }
-                if let Some(secs) = crate::state::recording_stuck_secs() {
-                    if secs >= WATCHDOG_MAX_RECORDING {
-                        warn!(
-                            "state watchdog: stuck in Recording for {secs}s — \
-                             ending it (likely a dropped HotkeyUp)"
-                        );
-                        // Route through the pipeline so the mic actually closes and
-                        // the captured audio is transcribed, not just the UI reset.
-                        if let Some(ptx) = PIPELINE_TX.get() {
-                            let _ = ptx.send(Event::HotkeyUp);
-                        }
-                    }
-                }
+///
+/// Whenever it intervenes it re-arms itself after `WATCHDOG_RETRY`: the nudge
+/// can be lost too (or the pipeline still busy), and the per-transition timer
+/// won't fire again while the state never changes. The retry chain ends on the
+/// first check that finds the state recovered.
+fn check_stuck_state(tx: &Sender<Event>, pipeline_tx: Option<&Sender<Event>>) {
+    let mut intervened = false;
+    if let Some(secs) = crate::state::processing_stuck_secs() {
+        if secs >= WATCHDOG_MAX_PROCESSING {
+            warn!("state watchdog: stuck in Processing for {secs}s — forcing Idle");
+            let _ = tx.send(Event::StateChanged(State::Idle));
+            intervened = true;
+        }
+    }
+    if let Some(secs) = crate::state::recording_stuck_secs() {
+        if secs >= WATCHDOG_MAX_RECORDING {
+            warn!(
+                "state watchdog: stuck in Recording for {secs}s — \
+                 ending it (likely a dropped HotkeyUp)"
+            );
+            // Route through the pipeline so the mic actually closes and the
+            // captured audio is transcribed, not just the UI reset.
+            if let Some(ptx) = pipeline_tx {
+                let _ = ptx.send(Event::HotkeyUp);
             }
-        })
-        .ok();
+            intervened = true;
+        }
+    }
+    if intervened {
+        schedule_main(WATCHDOG_RETRY, Event::CheckStuckState);
+    }
 }
 
 /// Autonomous pipeline: listens for hotkey events, captures audio,
@@ -1427,6 +1543,10 @@ fn pipeline_loop(
     ui_tx: Sender<Event>,
     self_tx: Sender<Event>,
 ) {
+    // Capture + transcription run here (and on threads spawned from here):
+    // keep them out of background QoS so they finish at foreground speed.
+    crate::util::set_thread_user_initiated();
+
     // Everything here runs on this one thread — no Arc/Mutex/atomics needed.
     let mut recording = false;
     let mut capture: Option<crate::audio::capture::AudioCapture> = None;
@@ -1464,11 +1584,11 @@ fn pipeline_loop(
 }
 
 /// Wake the macOS main run loop so a UI event sent from a worker thread drains
-/// now, instead of after the ~500 ms `WaitUntil` tick (the crossbeam channel
-/// doesn't itself wake winit). No-op off macOS. A bare `wake_up` creates no winit
-/// UserEvent, so it does NOT trip the Tahoe menu-close bug — do not reintroduce
-/// `EventLoopProxy` for this.
-fn wake_main() {
+/// or a flag set off-thread is seen now (the crossbeam channel doesn't itself
+/// wake winit, and macOS has no fallback tick). No-op off macOS. A bare
+/// `wake_up` creates no winit UserEvent, so it does NOT trip the Tahoe
+/// menu-close bug — do not reintroduce `EventLoopProxy` for this.
+pub(crate) fn wake_main() {
     #[cfg(target_os = "macos")]
     {
         use objc2_core_foundation::CFRunLoop;
@@ -1478,11 +1598,11 @@ fn wake_main() {
     }
 }
 
-/// Send a UI event from the pipeline thread and wake the main loop so the icon /
-/// overlay pill react immediately rather than lagging the WaitUntil tick.
+/// Send a UI event from the pipeline thread. The UI forwarder wakes the main
+/// loop on delivery, so the icon / overlay pill react immediately rather than
+/// lagging the fallback tick.
 fn notify_ui(ui_tx: &Sender<Event>, ev: Event) {
     let _ = ui_tx.send(ev);
-    wake_main();
 }
 
 /// Wait out the hold-delay gate. Returns `true` if the hold was cancelled before
@@ -1510,6 +1630,37 @@ fn hold_gate(rx: &Receiver<Event>, self_tx: &Sender<Event>, delay: f64) -> bool
     false
 }
 
+/// Poll interval of the toggle-mode end-pointing watcher.
+const AUTO_STOP_POLL: Duration = Duration::from_millis(50);
+
+/// Watch a toggle recording's end-pointer and ask the pipeline to end it once
+/// `limit` of silence has followed speech. Exits on its own when the recording
+/// ends first (the `Weak` stops upgrading).
+fn spawn_auto_stop(
+    endpointer: std::sync::Weak<crate::audio::capture::Endpointer>,
+    limit: Duration,
+    self_tx: Sender<Event>,
+) {
+    let spawned = std::thread::Builder::new()
+        .name("auto-stop".into())
+        .spawn(move || {
+            loop {
+                std::thread::sleep(AUTO_STOP_POLL);
+                let Some(ep) = endpointer.upgrade() else {
+                    return;
+                };
+                if ep.trailing_silence().is_some_and(|s| s >= limit) {
+                    drop(ep);
+                    let _ = self_tx.send(Event::AutoStop(endpointer));
+                    return;
+                }
+            }
+        });
+    if let Err(e) = spawned {
+        warn!("auto-stop watcher failed to start: {e}");
+    }
+}
+
 /// Handle one pipeline event. Split out of `pipeline_loop` so each event runs
 /// inside a `catch_unwind` at the call site — a panic here is contained and the
 /// loop resets to idle rather than the worker thread dying.
@@ -1611,21 +1762,36 @@ fn handle_pipeline_event(
                 if !crate::license::gate() {
                     return;
                 }
-                let (configured, language) = {
+                // One snapshot of the settings this press needs, like the hold
+                // path — not a second lock mid-start for the sound flag.
+                let (device, language, sound_feedback, auto_stop_ms) = {
                     let c = config.lock_safe();
-                    (c.input_device.clone(), c.language.clone())
+                    (
+                        crate::audio::effective_input_device(&c.input_device),
+                        c.language.clone(),
+                        c.sound_feedback,
+                        c.auto_stop_silence_ms,
+                    )
                 };
-                let device = crate::audio::effective_input_device(&configured);
-                // Pill up before the (synchronous) mic open, like the hold path.
+                // Pill and start cue before the (synchronous) mic open, like the
+                // hold path: the cue plays on its worker while the device opens,
+                // instead of only after it.
                 notify_ui(ui_tx, Event::ShowOverlay);
+                if sound_feedback {
+                    crate::audio::playback::play_sound("start");
+                }
                 match crate::audio::capture::AudioCapture::start(&device) {
                     Ok(cap) => {
+                        if auto_stop_ms > 0 {
+                            spawn_auto_stop(
+                                cap.endpointer(),
+                                Duration::from_millis(auto_stop_ms),
+                                self_tx.clone(),
+                            );
+                        }
                         *capture = Some(cap);
                         *recording = true;
                         notify_ui(ui_tx, Event::StateChanged(State::Recording));
-                        if config.lock_safe().sound_feedback {
-                            crate::audio::playback::play_sound("start");
-                        }
                         // Harvest on-screen names off-thread (#7), as in hold mode.
                         std::thread::spawn(move || {
                             crate::dictionary::update_session_context(&language)
@@ -1648,7 +1814,24 @@ fn handle_pipeline_event(
             }
         }
 
+        Event::AutoStop(endpointer) => {
+            // Only the recording this was armed for: if it already ended (by
+            // hotkey), the end-pointer is gone and a new recording is left alone.
+            if !*recording || endpointer.upgrade().is_none() {
+                return;
+            }
+            info!("Silence after speech — ending the recording");
+            *recording = false;
+            notify_ui(ui_tx, Event::StateChanged(State::Processing));
+            stop_and_transcribe(config, capture);
+            notify_ui(ui_tx, Event::StateChanged(State::Idle));
+        }
+
         Event::LoadModel(model_name) => {
+            if crate::transcribe::is_model_loaded(&model_name) {
+                info!("Model '{model_name}' is already loaded");
+                return;
+            }
             let start = std::time::Instant::now();
             info!("Loading model '{model_name}' on pipeline thread...");
 
@@ -1659,6 +1842,7 @@ fn handle_pipeline_event(
             crate::transcribe::unload_model();
             crate::transcribe::parakeet::unload_model();
             crate::transcribe::voxtral_local::unload_model();
+            crate::transcribe::set_loaded_model(None);
 
             let backend = crate::model_manager::resolve_backend(&model_name);
 
@@ -1685,11 +1869,20 @@ fn handle_pipeline_event(
                 }
                 ref b => crate::transcribe::ensure_loaded(b, &model_name),
             };
+            // Materialize the weights while we're still in Loading: one
+            // inference on a speech-like buffer faults them in and runs the
+            // decoder once, so the first hotkey press is warm.
+            // Panic-guarded like the keep-warm ticks — a failed warm-up must not
+            // take down the pipeline thread.
+            if load_result.is_ok() {
+                let _ = std::panic::catch_unwind(crate::transcribe::prime_loaded);
+            }
 
             let elapsed = start.elapsed();
             let name = backend.name();
             match load_result {
                 Ok(()) => {
+                    crate::transcribe::set_loaded_model(Some(&model_name));
                     info!("{name} model loaded ({:.1}s)", elapsed.as_secs_f64());
                     crate::notify::app(&format!("{name} ready! ({:.0}s)", elapsed.as_secs_f64()));
                 }
@@ -1729,24 +1922,11 @@ static TRAY_THROTTLE: Mutex<TrayThrottle> = Mutex::new(TrayThrottle {
     settle_at: None,
     scheduled: false,
 });
-/// Event sender used to fire the debounced flush on the main thread (set once in
-/// `run`). The push itself always happens on the main thread.
-static TRAY_TX: OnceLock<Sender<Event>> = OnceLock::new();
-
-/// Sender into the pipeline thread's own channel (set once when the pipeline is
-/// created). Lets the state watchdog inject a `HotkeyUp` to end a recording that
-/// got stranded by a dropped key-up — the watchdog itself is spawned before the
-/// pipeline exists, so it can't be handed the sender directly.
-static PIPELINE_TX: OnceLock<Sender<Event>> = OnceLock::new();
 
+/// The flush runs as a main-loop timer, so the push always happens on the main
+/// thread.
 fn schedule_tray_flush(after: Duration) {
-    if let Some(tx) = TRAY_TX.get() {
-        let tx = tx.clone();
-        std::thread::spawn(move || {
-            std::thread::sleep(after);
-            let _ = tx.send(Event::RefreshTrayIcon);
-        });
-    }
+    schedule_main(after, Event::RefreshTrayIcon);
 }
 
 fn set_tray_icon(tray: &Option<TrayIcon>, state: State) {
@@ -1775,8 +1955,8 @@ fn flush_tray_icon(tray: &Option<TrayIcon>) {
                     t.scheduled = false;
                     let d = t.desired;
                     if t.pushed != d {
-                        t.pushed = d;
-                        (d, None)
+                        let prev = std::mem::replace(&mut t.pushed, d);
+                        (d.map(|s| (s, prev)), None)
                     } else {
                         (None, None)
                     }
@@ -1790,15 +1970,18 @@ fn flush_tray_icon(tray: &Option<TrayIcon>) {
             }
         }
     };
-    if let Some(state) = push {
-        set_tray_icon_now(tray, state);
+    if let Some((state, prev)) = push {
+        set_tray_icon_now(tray, state, prev);
     }
     if let Some(wait) = reschedule {
         schedule_tray_flush(wait);
     }
 }
 
-fn set_tray_icon_now(tray: &Option<TrayIcon>, state: State) {
+/// `prev` is what the status item currently shows; when it already carries the
+/// same glyph (Loading ↔ Processing share the dimmed one) only the tooltip is
+/// updated — each image set is a status-item repaint over XPC.
+fn set_tray_icon_now(tray: &Option<TrayIcon>, state: State, prev: Option<State>) {
     // One glyph, four states — only colour/opacity change (see `glyph_icon`),
     // so the icon never shifts size or shape. All states except Recording are
     // macOS templates (monochrome, auto-adapt: white on a dark menu bar, black
@@ -1829,22 +2012,27 @@ fn set_tray_icon_now(tray: &Option<TrayIcon>, state: State) {
             "Whisper Push \u{2014} Ready",
         ),
     };
+    let busy = |s: State| matches!(s, State::Loading | State::Processing);
+    let same_glyph = prev.is_some_and(|p| p == state || (busy(p) && busy(state)));
     if let Some(tray) = tray {
-        if let Some(icon) = glyph_icon(style) {
-            // Set the image AND its template flag atomically. macOS renders a
-            // template image (the glyph is pure black + alpha) in the menu bar's
-            // contrasting label colour automatically — black on a light bar,
-            // white on a dark one — exactly like native menu-bar icons. Doing it
-            // in one call avoids the stale-flag bug of `set_icon` followed by a
-            // separate `set_icon_as_template` (where switching to the coloured
-            // Recording icon left the template state inconsistent). Recording
-            // passes `is_template = false` so it keeps its citron colour.
-            #[cfg(target_os = "macos")]
-            let _ = tray.set_icon_with_as_template(Some(icon), is_template);
-            #[cfg(not(target_os = "macos"))]
-            {
-                let _ = is_template; // template is a macOS-only concept
-                let _ = tray.set_icon(Some(icon));
+        // Image and template flag already right (same glyph) → tooltip only.
+        if !same_glyph {
+            if let Some(icon) = glyph_icon(style) {
+                // Set the image AND its template flag atomically. macOS renders a
+                // template image (the glyph is pure black + alpha) in the menu bar's
+                // contrasting label colour automatically — black on a light bar,
+                // white on a dark one — exactly like native menu-bar icons. Doing it
+                // in one call avoids the stale-flag bug of `set_icon` followed by a
+                // separate `set_icon_as_template` (where switching to the coloured
+                // Recording icon left the template state inconsistent). Recording
+                // passes `is_template = false` so it keeps its citron colour.
+                #[cfg(target_os = "macos")]
+                let _ = tray.set_icon_with_as_template(Some(icon), is_template);
+                #[cfg(not(target_os = "macos"))]
+                {
+                    let _ = is_template; // template is a macOS-only concept
+                    let _ = tray.set_icon(Some(icon));
+                }
             }
         }
         let _ = tray.set_tooltip(Some(tooltip));
@@ -1856,8 +2044,13 @@ fn stop_and_transcribe(
     config: &Arc<Mutex<Config>>,
     capture: &mut Option<crate::audio::capture::AudioCapture>,
 ) {
-    let cfg = config.lock_safe().clone();
-    if cfg.sound_feedback {
+    // Only three settings matter here — copy those out instead of cloning the
+    // whole Config (every String field) on each dictation.
+    let (sound_feedback, model, language) = {
+        let c = config.lock_safe();
+        (c.sound_feedback, c.model.clone(), c.language.clone())
+    };
+    if sound_feedback {
         crate::audio::playback::play_sound("stop");
     }
 
@@ -1894,16 +2087,32 @@ fn stop_and_transcribe(
                 return;
             }
         }
-        // Every input is silent → systemic (likely Microphone permission). Fall
-        // through; the empty transcription is harmless and the log shows why.
+        // Every input is silent → systemic (likely Microphone permission). The
+        // no-speech gate below skips it; the log shows why.
     } else {
         // Good signal — forget any earlier dead-mic memory so devices that
         // recover become eligible again.
         crate::audio::clear_dead_mics();
     }
+    // Nothing louder than room tone: no speech, so don't run the engine at all.
+    if peak < crate::audio::SPEECH_MIN_PEAK {
+        info!("No speech (peak={peak:.4}), skipping");
+        return;
+    }
+
+    // Hand the engine only the voiced part — the hold before and after speaking
+    // is pure encoder time.
+    let captured = audio.len();
+    let audio = crate::audio::trim_silence(&audio);
+    if audio.len() < captured {
+        tracing::debug!(
+            "Trimmed {:.1}s of silence",
+            (captured - audio.len()) as f32 / crate::audio::SAMPLE_RATE as f32
+        );
+    }
 
-    let rms = crate::util::rms(&audio);
-    let backend = crate::model_manager::resolve_backend(&cfg.model);
+    let rms = crate::util::rms(audio);
+    let backend = crate::model_manager::resolve_backend(&model);
     info!(
         "Processing {:.1}s of audio with backend '{}' (RMS={:.4})...",
         audio.len() as f32 / crate::audio::SAMPLE_RATE as f32,
@@ -1914,11 +2123,14 @@ fn stop_and_transcribe(
     // (The session-context harvest — focused field / selection / clipboard — now
     // runs on a detached thread at record-start, so its AX reads never sit
     // between key-up and transcription. See the HotkeyDown / HotkeyToggle arms.)
+    // Likewise the previous dictation's auto-capture: settle it on the paste
+    // worker while we transcribe, not between the text and its Cmd+V.
+    crate::paste::prepare_paste();
 
     let start = std::time::Instant::now();
     // Panics are already caught inside transcribe_with_backend (the choke point)
     // and returned as Err, so no extra catch_unwind is needed here.
-    let result = crate::transcribe::transcribe_with_backend(&audio, &cfg.language, &backend);
+    let result = crate::transcribe::transcribe_with_backend(audio, &language, &backend);
     match result {
         Ok(text) if !text.is_empty() => {
             // Record the run so the user can find/re-copy it (History submenu +
@@ -1926,7 +2138,8 @@ fn stop_and_transcribe(
             crate::history::record(&text);
             // If the whole dictation matches a template trigger, paste its
             // expansion instead (e.g. say "signature" → paste your signature).
-            let to_paste = crate::templates::expand(&text).unwrap_or_else(|| text.clone());
+            let expansion = crate::templates::expand(&text);
+            let to_paste = expansion.as_deref().unwrap_or(&text);
             info!(
                 "Pasting ({:.2}s): '{}'",
                 start.elapsed().as_secs_f64(),
@@ -1934,9 +2147,9 @@ fn stop_and_transcribe(
                 // lands mid-codepoint (French accents, CJK — all in scope).
                 to_paste.chars().take(80).collect::<String>()
             );
-            if let Err(e) = crate::paste::paste_text(&to_paste) {
-                tracing::error!("Paste failed: {e}");
-            }
+            // Queued: the pipeline goes back to Idle while the paste worker
+            // waits out the target app and restores the clipboard.
+            crate::paste::paste_text_queued(to_paste.to_string());
             // No per-dictation notification (noise).
         }
         Ok(_) => info!("No speech detected"),
@@ -1950,7 +2163,9 @@ fn stop_and_transcribe(
 /// Open a file with the OS default handler (cross-platform).
 fn open_path(path: &std::path::Path) {
     #[cfg(target_os = "macos")]
-    let _ = std::process::Command::new("open").arg(path).spawn();
+    let _ = std::process::Command::new("/usr/bin/open")
+        .arg(path)
+        .spawn();
     #[cfg(target_os = "linux")]
     let _ = std::process::Command::new("xdg-open").arg(path).spawn();
     #[cfg(target_os = "windows")]
@@ -1960,61 +2175,84 @@ fn open_path(path: &std::path::Path) {
         .spawn();
 }
 
-/// Build the recent-dictation entries for the History submenu. Returns
-/// (item, full text) so a click can copy the full (possibly multi-line) text;
-/// the label is a one-line preview. A disabled placeholder (empty text) shows
-/// when there's no history yet.
-fn populate_history_entries(submenu: &Submenu) -> Vec<(MenuItem, String)> {
+/// Fill the History submenu's recent-dictation entries. Each row is
+/// (label, enabled, full text) so a click can copy the full (possibly
+/// multi-line) text; the label is a one-line preview. A disabled placeholder
+/// (empty text) shows when there's no history yet.
+fn populate_history_entries(submenu: &Submenu, items: &mut Vec<(MenuItem, String)>) {
     const MAX: usize = 12;
     const PREVIEW: usize = 48;
     let recent = crate::history::recent();
-    let mut items = Vec::new();
+    let mut rows = Vec::new();
     if recent.is_empty() {
-        let ph = MenuItem::new("  (empty \u{2014} your dictations will appear here)", false, None);
-        let _ = submenu.append(&ph);
-        items.push((ph, String::new()));
-        return items;
+        rows.push((
+            "  (empty \u{2014} your dictations will appear here)".to_string(),
+            false,
+            String::new(),
+        ));
     }
     for text in recent.iter().take(MAX) {
         let mut preview = text.split_whitespace().collect::<Vec<_>>().join(" ");
         if preview.chars().count() > PREVIEW {
             preview = format!("{}\u{2026}", preview.chars().take(PREVIEW).collect::<String>());
         }
-        let it = MenuItem::new(&format!("  {preview}"), true, None);
-        let _ = submenu.append(&it);
-        items.push((it, text.clone()));
+        rows.push((format!("  {preview}"), true, text.clone()));
+    }
+    sync_rows(submenu, items, rows);
+}
+
+/// Make the trailing entry `items` of `submenu` show `rows` (label, enabled,
+/// payload). Existing items are relabelled in place and only the difference is
+/// appended / removed, so a refresh after each dictation doesn't tear down and
+/// re-create every native menu item. Item IDs survive, and clicks are matched
+/// against `items`, so the payloads stay in step.
+fn sync_rows(
+    submenu: &Submenu,
+    items: &mut Vec<(MenuItem, String)>,
+    rows: Vec<(String, bool, String)>,
+) {
+    let keep = rows.len().min(items.len());
+    for (it, _) in items.drain(keep..) {
+        let _ = submenu.remove(&it);
+    }
+    for (i, (label, enabled, payload)) in rows.into_iter().enumerate() {
+        if let Some((it, p)) = items.get_mut(i) {
+            it.set_text(&label);
+            it.set_enabled(enabled);
+            *p = payload;
+        } else {
+            let it = MenuItem::new(&label, enabled, None);
+            let _ = submenu.append(&it);
+            items.push((it, payload));
+        }
     }
-    items
 }
 
-/// Build the trigger labels for the Templates submenu (disabled — the live
-/// actions are Add / Open). Returns (item, trigger).
-fn populate_template_items(submenu: &Submenu) -> Vec<(MenuItem, String)> {
+/// Fill the trigger labels of the Templates submenu (the live actions are
+/// Add / Open). Rows carry the trigger as payload.
+fn populate_template_items(submenu: &Submenu, items: &mut Vec<(MenuItem, String)>) {
     const MAX: usize = 30;
     let triggers = crate::templates::triggers();
-    let mut items = Vec::new();
+    let mut rows = Vec::new();
     if triggers.is_empty() {
-        let ph = MenuItem::new("  (none yet \u{2014} use Add Template\u{2026})", false, None);
-        let _ = submenu.append(&ph);
-        items.push((ph, String::new()));
-        return items;
+        rows.push((
+            "  (none yet \u{2014} use Add Template\u{2026})".to_string(),
+            false,
+            String::new(),
+        ));
     }
     for t in triggers.iter().take(MAX) {
         // Enabled so a click opens the edit/delete dialog.
-        let it = MenuItem::new(&format!("  \u{201c}{t}\u{201d}"), true, None);
-        let _ = submenu.append(&it);
-        items.push((it, t.clone()));
+        rows.push((format!("  \u{201c}{t}\u{201d}"), true, t.clone()));
     }
     if triggers.len() > MAX {
-        let more = MenuItem::new(
-            &format!("  \u{2026} +{} more (use Open file)", triggers.len() - MAX),
+        rows.push((
+            format!("  \u{2026} +{} more (use Open file)", triggers.len() - MAX),
             false,
-            None,
-        );
-        let _ = submenu.append(&more);
-        items.push((more, String::new()));
+            String::new(),
+        ));
     }
-    items
+    sync_rows(submenu, items, rows);
 }
 
 /// "Add Template…" dialog: ask for the trigger, then the content, then save.
@@ -2117,7 +2355,7 @@ fn osascript_choice(message: &str, buttons: &[&str]) -> Option<String> {
         crate::notify::applescript_escape(cancel),
         crate::notify::applescript_escape(cancel),
     );
-    let out = std::process::Command::new("osascript")
+    let out = std::process::Command::new("/usr/bin/osascript")
         .arg("-e")
         .arg(&script)
         .output()
@@ -2132,22 +2370,19 @@ fn osascript_choice(message: &str, buttons: &[&str]) -> Option<String> {
     )
 }
 
-/// Append one (removable) menu item per dictionary entry; returns them paired
-/// with their term so clicks map back. A disabled placeholder (empty term) is
-/// shown when the dictionary is empty or truncated.
-fn populate_dict_entries(submenu: &Submenu) -> Vec<(MenuItem, String)> {
+/// One (removable) menu item per dictionary entry, paired in `items` with its
+/// term so clicks map back. A disabled placeholder (empty term) is shown when
+/// the dictionary is empty or truncated.
+fn populate_dict_entries(submenu: &Submenu, items: &mut Vec<(MenuItem, String)>) {
     const MAX: usize = 40;
     let entries = crate::dictionary::list_entries();
-    let mut items = Vec::new();
+    let mut rows = Vec::new();
     if entries.is_empty() {
-        let ph = MenuItem::new(
-            "  (empty \u{2014} your corrections will appear here)",
+        rows.push((
+            "  (empty \u{2014} your corrections will appear here)".to_string(),
             false,
-            None,
-        );
-        let _ = submenu.append(&ph);
-        items.push((ph, String::new()));
-        return items;
+            String::new(),
+        ));
     }
     for e in entries.iter().take(MAX) {
         let star = if e.starred { "\u{2605} " } else { "" };
@@ -2156,20 +2391,16 @@ fn populate_dict_entries(submenu: &Submenu) -> Vec<(MenuItem, String)> {
         } else {
             format!("  {star}{}  \u{2190}  {}", e.term, e.variants.join(", "))
         };
-        let it = MenuItem::new(&label, true, None);
-        let _ = submenu.append(&it);
-        items.push((it, e.term.clone()));
+        rows.push((label, true, e.term.clone()));
     }
     if entries.len() > MAX {
-        let more = MenuItem::new(
-            &format!("  \u{2026} +{} more (use Open file)", entries.len() - MAX),
+        rows.push((
+            format!("  \u{2026} +{} more (use Open file)", entries.len() - MAX),
             false,
-            None,
-        );
-        let _ = submenu.append(&more);
-        items.push((more, String::new()));
+            String::new(),
+        ));
     }
-    items
+    sync_rows(submenu, items, rows);
 }
 
 /// Native dialog prefilled with the last dictation; on Save, learn from the
@@ -2304,7 +2535,7 @@ fn osascript_confirm(message: &str, confirm_btn: &str) -> bool {
         crate::notify::applescript_escape(message),
         crate::notify::applescript_escape(confirm_btn),
     );
-    std::process::Command::new("osascript")
+    std::process::Command::new("/usr/bin/osascript")
         .arg("-e")
         .arg(&script)
         .output()
@@ -2327,7 +2558,7 @@ fn osascript_input(message: &str, prefill: &str) -> Option<String> {
         crate::notify::applescript_escape(message),
         crate::notify::applescript_escape(prefill)
     );
-    let out = std::process::Command::new("osascript")
+    let out = std::process::Command::new("/usr/bin/osascript")
         .arg("-e")
         .arg(&script)
         .output()
@@ -2350,22 +2581,24 @@ fn osascript_input(_message: &str, _prefill: &str) -> Option<String> {
     None
 }
 
+/// Hotkey token → menu glyph(s); anything else is shown upper-cased.
+const HOTKEY_SYMBOLS: &[(&str, &str)] = &[
+    ("cmd", "\u{2318}"),
+    ("shift", "\u{21e7}"),
+    ("alt", "\u{2325}"),
+    ("ctrl", "\u{2303}"),
+    ("rctrl", "\u{2303}R"),
+    ("rcmd", "\u{2318}R"),
+    ("ralt", "\u{2325}R"),
+    ("rshift", "\u{21e7}R"),
+    ("lctrl", "\u{2303}L"),
+    ("lcmd", "\u{2318}L"),
+    ("lalt", "\u{2325}L"),
+    ("lshift", "\u{21e7}L"),
+    ("space", "Space"),
+];
+
 pub fn format_hotkey_display(hotkey: &str, mode: &str) -> String {
-    let symbols: &[(&str, &str)] = &[
-        ("cmd", "\u{2318}"),
-        ("shift", "\u{21e7}"),
-        ("alt", "\u{2325}"),
-        ("ctrl", "\u{2303}"),
-        ("rctrl", "\u{2303}R"),
-        ("rcmd", "\u{2318}R"),
-        ("ralt", "\u{2325}R"),
-        ("rshift", "\u{21e7}R"),
-        ("lctrl", "\u{2303}L"),
-        ("lcmd", "\u{2318}L"),
-        ("lalt", "\u{2325}L"),
-        ("lshift", "\u{21e7}L"),
-        ("space", "Space"),
-    ];
     let mut r = if mode == "hold" {
         "Hold ".into()
     } else {
@@ -2376,7 +2609,7 @@ pub fn format_hotkey_display(hotkey: &str, mode: &str) -> String {
         if i > 0 {
             r.push('+');
         }
-        if let Some((_, s)) = symbols.iter().find(|(k, _)| *k == p) {
+        if let Some((_, s)) = HOTKEY_SYMBOLS.iter().find(|(k, _)| *k == p) {
             r.push_str(s);
         } else {
             r.push_str(&p.to_uppercase());
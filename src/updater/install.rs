@@ -191,7 +191,7 @@ fn install_and_relaunch(new_app: &Path) -> Result<()> {
     info!("Update installed to /Applications/Whisper Push.app");
 
     // Step 3: Relaunch the new version with --post-update flag
-    let _ = std::process::Command::new("open")
+    let _ = std::process::Command::new("/usr/bin/open")
         .arg(&installed)
         .arg("--args")
         .arg("--post-update")
@@ -44,7 +44,9 @@ impl<T> LockSafe<T> for Mutex<T> {
 /// code 0. This matters now that the LaunchAgent uses
 /// `KeepAlive{SuccessfulExit:false}`: an *abnormal* abort on a user-requested
 /// Quit would otherwise make launchd resurrect the app instead of staying down.
+/// The hotkey listener is detached first (see `hotkey::stop_listener`).
 pub fn exit_clean() -> ! {
+    crate::hotkey::stop_listener();
     // SAFETY: `_exit` simply terminates the process; no Rust/C dtors or atexit
     // handlers run. We accept losing any buffered (non-blocking) log lines.
     unsafe { libc::_exit(0) }
@@ -71,6 +73,20 @@ where
     rx.recv_timeout(timeout).ok()
 }
 
+/// Mark the calling thread as user-initiated work (macOS QoS). Threads it
+/// creates afterwards — e.g. the ggml compute pool whisper spins up per
+/// inference — inherit the class. Without this, an accessory (menu-bar) app's
+/// worker threads can be scheduled as background work and a sub-second
+/// transcription stretches long enough to trip the Processing watchdog. No-op
+/// elsewhere.
+pub fn set_thread_user_initiated() {
+    #[cfg(target_os = "macos")]
+    // SAFETY: only adjusts the calling thread's own scheduling class.
+    unsafe {
+        libc::pthread_set_qos_class_self_np(libc::qos_class_t::QOS_CLASS_USER_INITIATED, 0);
+    }
+}
+
 /// Seconds since the Unix epoch (0 if the system clock predates 1970). Single
 /// source for the several call sites that timestamp with wall-clock seconds.
 pub fn now_secs() -> u64 {